@@ -1,7 +1,7 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import heapq
+
+from pathfinder import build_graph
+from pathfinder.sample_profiles import get_sample_objectives, get_sample_weights
 
 # Set page configuration
 st.set_page_config(
@@ -36,11 +36,30 @@ with st.sidebar:
     )
     
     time_constraint = st.slider("Time available (hours per week):", 1, 20, 10)
+    weeks = st.slider("Weeks until you apply:", 1, 12, 4)
     
     analyze_button = st.button(" Find My Optimal Path", type="primary")
 
+# Weight ranges that keep each personality's optimal path, computed once for all
+@st.cache_data
+def tolerance_ranges():
+    from pathfinder import ACTIVITY_NAMES
+    from pathfinder.compiled_graph import internship_graph, internship_tolerances
+    from pathfinder.sample_profiles import PERSONALITIES
+    weights = [[get_sample_weights(p)[a] for a in ACTIVITY_NAMES] for p in PERSONALITIES]
+    lower, upper = internship_tolerances(internship_graph(), weights)
+    return {p: dict(zip(ACTIVITY_NAMES, zip(lower[i].tolist(), upper[i].tolist())))
+            for i, p in enumerate(PERSONALITIES)}
+
+def range_text(activity):
+    lower, upper = tolerance_ranges()[personality][activity]
+    low = "0" if lower <= 0 else f"{lower:.2f}"
+    high = "∞" if upper == float('inf') else f"{upper:.2f}"
+    return f"{weights[activity]:.2f} (keeps the path from {low} to {high})"
+
 # Data loading function
 def load_data():
+    import pandas as pd  # only needed for the survey file
     try:
         file_path = r"C:\Users\salma\Documents\network analysis project\Fillout New form ezuaT results (2).csv"
         df = pd.read_csv(file_path)
@@ -50,121 +69,19 @@ def load_data():
         st.warning("Using sample data - original file not found")
         return pd.DataFrame()
 
-# Graph class
-class InternshipGraph:
-    def __init__(self):
-        self.edges = {}
-    
-    def add_node(self, node):
-        if node not in self.edges:
-            self.edges[node] = {}
-    
-    def add_edge(self, from_node, to_node, weight):
-        self.add_node(from_node)
-        self.add_node(to_node)
-        self.edges[from_node][to_node] = weight
-    
-    def dijkstra(self, start, end):
-        distances = {node: float('inf') for node in self.edges}
-        distances[start] = 0
-        previous = {}
-        pq = [(0, start)]
-        
-        while pq:
-            current_dist, current_node = heapq.heappop(pq)
-            
-            if current_node == end:
-                break
-                
-            if current_dist > distances[current_node]:
-                continue
-                
-            if current_node in self.edges:
-                for neighbor, weight in self.edges[current_node].items():
-                    distance = current_dist + weight
-                    if distance < distances[neighbor]:
-                        distances[neighbor] = distance
-                        previous[neighbor] = current_node
-                        heapq.heappush(pq, (distance, neighbor))
-        
-        # Reconstruct path
-        path = []
-        current = end
-        while current != start:
-            path.append(current)
-            current = previous.get(current)
-            if current is None:
-                return [], float('inf')
-        path.append(start)
-        path.reverse()
-        return path, distances[end]
-
-# Sample weights (replace with your actual data loading)
-def get_sample_weights(personality):
-    if personality == "Shy":
-        return {
-            'Free_Courses': 0.8, 'Workshops': 1.2, 'Hackathons_Events': 1.5, 'Clubs_Orgs': 1.4,
-            'LinkedIn_Optimized': 0.9, 'CV_Ready': 0.7, 'Career_Fair': 1.3,
-            'Alumni_Network': 1.6, 'Professors': 1.4, 'Job_Platforms': 0.9,
-            'Direct_Apply': 1.1, 'Company_Contact': 1.5, 'Interview': 1.0
-        }
-    elif personality == "Neutral":
-        return {
-            'Free_Courses': 1.0, 'Workshops': 1.0, 'Hackathons_Events': 1.2, 'Clubs_Orgs': 1.1,
-            'LinkedIn_Optimized': 0.8, 'CV_Ready': 0.8, 'Career_Fair': 1.0,
-            'Alumni_Network': 1.2, 'Professors': 1.1, 'Job_Platforms': 0.9,
-            'Direct_Apply': 1.0, 'Company_Contact': 1.2, 'Interview': 0.9
-        }
-    else:  # Social
-        return {
-            'Free_Courses': 1.2, 'Workshops': 0.9, 'Hackathons_Events': 0.8, 'Clubs_Orgs': 0.7,
-            'LinkedIn_Optimized': 0.7, 'CV_Ready': 0.8, 'Career_Fair': 0.9,
-            'Alumni_Network': 0.8, 'Professors': 0.9, 'Job_Platforms': 1.0,
-            'Direct_Apply': 1.1, 'Company_Contact': 0.8, 'Interview': 0.8
-        }
-
-def build_graph(weights):
-    graph = InternshipGraph()
-    
-    # Student → Learning Activities
-    graph.add_edge("Student", "Free_Courses", weights['Free_Courses'])
-    graph.add_edge("Student", "Workshops", weights['Workshops'])
-    graph.add_edge("Student", "Hackathons_Events", weights['Hackathons_Events'])
-    graph.add_edge("Student", "Clubs_Orgs", weights['Clubs_Orgs'])
-    
-    # Learning Activities → Develop_Skills
-    graph.add_edge("Free_Courses", "Develop_Skills", weights['Free_Courses'] * 0.5)
-    graph.add_edge("Workshops", "Develop_Skills", weights['Workshops'] * 0.5)
-    graph.add_edge("Hackathons_Events", "Develop_Skills", weights['Hackathons_Events'] * 0.5)
-    graph.add_edge("Clubs_Orgs", "Develop_Skills", weights['Clubs_Orgs'] * 0.5)
-    
-    # Develop_Skills → Profile Building
-    graph.add_edge("Develop_Skills", "LinkedIn_Optimized", weights['LinkedIn_Optimized'])
-    graph.add_edge("Develop_Skills", "CV_Ready", weights['CV_Ready'])
-    
-    # Profile Building → Application Methods
-    app_methods = ['Career_Fair', 'Alumni_Network', 'Professors', 'Job_Platforms', 'Direct_Apply', 'Company_Contact']
-    for method in app_methods:
-        graph.add_edge("LinkedIn_Optimized", method, weights[method])
-        graph.add_edge("CV_Ready", method, weights[method])
-    
-    # Application Methods → Interview
-    for method in app_methods:
-        graph.add_edge(method, "Interview", weights['Interview'])
-    
-    # Interview → Internship_Offer
-    graph.add_edge("Interview", "Internship_Offer", 0.1)
-    
-    return graph
-
 # Main app logic
 if analyze_button:
     # Get weights for selected personality
     weights = get_sample_weights(personality)
     
-    # Build graph and find path
-    graph = build_graph(weights)
-    path, total_cost = graph.dijkstra("Student", "Internship_Offer")
+    # Build graph and find the cheapest path that fits the time budget
+    graph = build_graph(weights, attributes=get_sample_objectives(personality))
+    budget = time_constraint * weeks
+    path, total_cost, total_hours = graph.constrained_path("Student", "Internship_Offer", budget)
+    if not path:
+        st.warning(f"No path fits in {budget} hours; showing the optimal path regardless")
+        path, total_cost = graph.dijkstra("Student", "Internship_Offer")
+        total_hours = graph.path_attribute(path, 'hours')
     
     st.subheader(f" Your {personality} Personality Path")
     
@@ -177,13 +94,32 @@ if analyze_button:
     with col3:
         st.metric("Total Cost", f"{total_cost:.2f}")
     with col4:
-        st.metric("Time Available", f"{time_constraint} hrs/week")
+        st.metric("Time Needed", f"{total_hours:.0f} / {budget} hrs")
     
     
     st.subheader(" Optimal Path")
     path_text = " → ".join(path)
     st.success(path_text)
     
+    # Ranked alternatives (Yen's k shortest paths) that also fit the budget
+    ranked = graph.k_shortest_paths("Student", "Internship_Offer", 10)
+    with st.expander("Alternative Paths"):
+        alternatives = [(alt_path, alt_cost) for alt_path, alt_cost in ranked
+                        if alt_path != path and graph.path_attribute(alt_path, 'hours') <= budget][:4]
+        if not alternatives:
+            st.write(f"No other path fits in {budget} hours.")
+        for rank, (alt_path, alt_cost) in enumerate(alternatives, start=2):
+            st.write(f"**#{rank}** (cost {alt_cost:.2f}): {' → '.join(alt_path)}")
+    
+    # Pareto front: difficulty, value and time kept apart instead of one cost
+    with st.expander("Trade-off Paths"):
+        front = graph.pareto_paths("Student", "Internship_Offer")
+        st.table([
+            {'Path': ' → '.join(p), 'Difficulty': round(d, 1), 'Value Deficit': round(v, 1), 'Hours': round(h, 1)}
+            for p, (d, v, h) in front
+        ])
+        st.caption("None of these paths beats another on difficulty, value and time at once; pick your balance.")
+    
     # Step-by-step guide
     st.subheader(" Step-by-Step Guide")
     for i, step in enumerate(path):
@@ -215,17 +151,23 @@ if analyze_button:
     
     with col1:
         st.write("**Learning Methods:**")
-        st.write(f"- Free Courses: {weights['Free_Courses']:.2f}")
-        st.write(f"- Workshops: {weights['Workshops']:.2f}")
-        st.write(f"- Hackathons: {weights['Hackathons_Events']:.2f}")
-        st.write(f"- Clubs/Orgs: {weights['Clubs_Orgs']:.2f}")
+        st.write(f"- Free Courses: {range_text('Free_Courses')}")
+        st.write(f"- Workshops: {range_text('Workshops')}")
+        st.write(f"- Hackathons: {range_text('Hackathons_Events')}")
+        st.write(f"- Clubs/Orgs: {range_text('Clubs_Orgs')}")
     
     with col2:
         st.write("**Application Methods:**")
-        st.write(f"- Job Platforms: {weights['Job_Platforms']:.2f}")
-        st.write(f"- Career Fair: {weights['Career_Fair']:.2f}")
-        st.write(f"- Alumni Network: {weights['Alumni_Network']:.2f}")
-        st.write(f"- Direct Apply: {weights['Direct_Apply']:.2f}")
+        st.write(f"- Job Platforms: {range_text('Job_Platforms')}")
+        st.write(f"- Career Fair: {range_text('Career_Fair')}")
+        st.write(f"- Alumni Network: {range_text('Alumni_Network')}")
+        st.write(f"- Direct Apply: {range_text('Direct_Apply')}")
+    
+    st.caption("Each range is how far that activity's weight (difficulty / value) can move, the others "
+               "unchanged, before the optimal path (without the time budget) changes.")
+    if ranked and ranked[0][0] != path:
+        st.caption(f"Without the time budget the optimal path is {' → '.join(ranked[0][0])} "
+                   f"(cost {ranked[0][1]:.2f}).")
 
 else:
     # Initial instructions
@@ -0,0 +1,75 @@
+"""Smoke check: run Demo.py's "Find My Optimal Path" handler without a browser.
+
+    python benchmarks/check_demo.py
+
+Executes Demo.py once per personality and time budget against a stand-in
+for the streamlit module whose widgets return fixed values and whose
+button is pressed; output calls are recorded and discarded. Exits with
+status 1 and prints the traceback of every run that raised.
+"""
+import os
+import runpy
+import sys
+import traceback
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pathfinder.sample_profiles import PERSONALITIES  # noqa: E402
+
+DEMO = os.path.join(ROOT, 'Demo.py')
+# (hours per week, weeks): the smallest budget, the default and the largest
+BUDGETS = [(1, 1), (10, 4), (20, 12)]
+
+
+class Block:
+    # Context manager for st.sidebar, st.columns() and st.expander()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def fake_streamlit(personality, hours, weeks):
+    st = types.ModuleType('streamlit')
+    st.calls = []
+
+    def record(name):
+        def call(*args, **kwargs):
+            st.calls.append(name)
+        return call
+
+    for name in ('set_page_config', 'title', 'header', 'subheader', 'write', 'caption', 'code', 'metric',
+                 'success', 'warning', 'table'):
+        setattr(st, name, record(name))
+    st.sidebar = Block()
+    st.columns = lambda n: [Block() for _ in range(n)]
+    st.expander = lambda label, **kwargs: Block()
+    st.cache_data = lambda function: function
+    st.selectbox = lambda label, options, index=0, **kwargs: personality
+    st.multiselect = lambda label, options, **kwargs: []
+    st.select_slider = lambda label, options, value=None, **kwargs: value
+    st.slider = lambda label, low, high, value, **kwargs: hours if 'per week' in label else weeks
+    st.button = lambda label, **kwargs: True
+    return st
+
+
+def main():
+    failures = 0
+    for personality in PERSONALITIES:
+        for hours, weeks in BUDGETS:
+            sys.modules['streamlit'] = fake_streamlit(personality, hours, weeks)
+            try:
+                runpy.run_path(DEMO, run_name='__main__')
+            except Exception:
+                failures += 1
+                print(f"{personality}, {hours} h/week x {weeks} weeks:", file=sys.stderr)
+                traceback.print_exc()
+    print(f"{len(PERSONALITIES) * len(BUDGETS)} Demo.py runs: {failures} failed")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Brute-force agreement check: CompiledGraph.solve_batch() and the frozen DAG pass against dijkstra().
+
+    python benchmarks/check_solvers.py              # 500 random DAGs
+    python benchmarks/check_solvers.py --graphs 5000 --seed 7 --zero-share 0.5
+
+Random DAGs with weights rounded to one decimal and a share of them zero,
+so equal-cost ties, zero-length ties and paths of different lengths are
+common. Every profile of every graph must get the same path and cost from
+the batched solver and from the frozen graph's topological pass as from a
+fresh dict dijkstra(); exits with status 1 and prints the first mismatches
+otherwise.
+"""
+import argparse
+import os
+import random
+import sys
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pathfinder.internship_graph import InternshipGraph  # noqa: E402
+
+SEED = 20251130
+DEFAULT_ZERO_SHARE = 0.2
+
+
+def random_weight(rng, zero_share):
+    return 0.0 if rng.random() < zero_share else round(rng.uniform(0.1, 3.0), 1)
+
+
+def random_dag(rng, n_nodes, density, zero_share):
+    # Edges only go from lower to higher node numbers; names are shuffled so
+    # name order and topological order disagree
+    names = [f"n{i:03d}" for i in range(n_nodes)]
+    rng.shuffle(names)
+    graph = InternshipGraph()
+    for name in names:
+        graph.add_node(name)
+    for i in range(n_nodes):
+        for j in range(i + 1, n_nodes):
+            if rng.random() < density:
+                graph.add_edge(names[i], names[j], random_weight(rng, zero_share))
+    return graph, names[0], names[-1]
+
+
+def check_graph(rng, n_nodes, density, profiles, zero_share):
+    # Mismatch descriptions for one random graph and several weight rows
+    template, start, end = random_dag(rng, n_nodes, density, zero_share)
+    compiled = template.freeze()
+    if compiled.num_edges == 0:
+        return []
+    W = np.array([[random_weight(rng, zero_share) for _ in range(compiled.num_edges)] for _ in range(profiles)])
+    paths, costs = compiled.solve_batch(W, start, end)
+    sources = compiled._edge_sources().tolist()
+    targets = compiled.targets.tolist()
+
+    mismatches = []
+    for row, path, cost in zip(W.tolist(), paths, costs.tolist()):
+        graph = InternshipGraph()
+        for node in compiled.nodes:
+            graph.add_node(node)
+        for u, v, weight in zip(sources, targets, row):
+            graph.add_edge(compiled.nodes[u], compiled.nodes[v], weight)
+        expected_path, expected_cost = graph.dijkstra(start, end)
+        graph.freeze()
+        for solver, (got_path, got_cost) in (('solve_batch', (path, cost)),
+                                             ('frozen dijkstra', graph.dijkstra(start, end))):
+            if got_path != expected_path or not (got_cost == expected_cost or abs(got_cost - expected_cost) < 1e-9):
+                mismatches.append(f"{n_nodes} nodes: {solver} {got_path} {got_cost!r}, "
+                                  f"dijkstra {expected_path} {expected_cost!r}")
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--graphs', type=int, default=500)
+    parser.add_argument('--profiles', type=int, default=4, help="weight rows per graph")
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--zero-share', type=float, default=DEFAULT_ZERO_SHARE, help="share of zero edge weights")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    mismatches = []
+    for _ in range(args.graphs):
+        mismatches += check_graph(rng, rng.randint(2, 16), rng.uniform(0.1, 0.6), args.profiles, args.zero_share)
+    for line in mismatches[:10]:
+        print(line, file=sys.stderr)
+    print(f"{args.graphs} graphs x {args.profiles} profiles: {len(mismatches)} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
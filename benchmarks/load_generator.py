@@ -0,0 +1,169 @@
+"""Load generator for the path-query service.
+
+    python benchmarks/load_generator.py                           # in-process server on a free port
+    python benchmarks/load_generator.py --url http://127.0.0.1:8080 -c 64 -n 20000
+    python benchmarks/load_generator.py --unique 0.5 --batch 128  # half distinct queries, batched
+
+Keeps --concurrency keep-alive connections busy until --requests requests
+have completed and prints a JSON summary: p50/p90/p99 latency, requests and
+queries per second, error count and the service's /stats counters.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pathfinder.internship_graph import ACTIVITY_NAMES, SEARCH_STRATEGIES  # noqa: E402
+from pathfinder.sample_profiles import PERSONALITIES  # noqa: E402
+from pathfinder.service import PathService, start_server  # noqa: E402
+
+SEED = 20251130
+
+
+# -------------------------
+# Workload
+# -------------------------
+def make_queries(count, unique, seed=SEED):
+    # `unique` is the share of queries with their own random weights; the rest
+    # repeat the sample personalities and should hit the cache or coalesce
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        if rng.random() < unique:
+            queries.append({'weights': {a: round(rng.uniform(0.2, 2.0), 3) for a in ACTIVITY_NAMES},
+                            'strategy': rng.choice(SEARCH_STRATEGIES)})
+        else:
+            queries.append({'personality': rng.choice(PERSONALITIES)})
+    return queries
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# -------------------------
+# Client
+# -------------------------
+class Connection:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.writer.write((f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                           f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode()
+                          + body)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+async def run_load(host, port, queries, concurrency, batch=1):
+    """Latencies and error count for sending every query once."""
+    if batch > 1:
+        requests = [('/batch', {'queries': queries[i:i + batch]}) for i in range(0, len(queries), batch)]
+    else:
+        requests = [('/path', query) for query in queries]
+    pending = iter(requests)
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        connection = Connection(host, port)
+        try:
+            for path, payload in pending:
+                started = time.perf_counter()
+                status, _ = await connection.request('POST', path, payload)
+                latencies.append(time.perf_counter() - started)
+                errors += status != 200
+        finally:
+            await connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    connection = Connection(host, port)
+    _, service_stats = await connection.request('GET', '/stats')
+    await connection.close()
+    return {
+        'requests': len(requests),
+        'queries': len(queries),
+        'errors': errors,
+        'seconds': elapsed,
+        'requests_per_second': len(requests) / elapsed,
+        'queries_per_second': len(queries) / elapsed,
+        'latency_ms': {
+            'p50': percentile(latencies, 0.50) * 1e3,
+            'p90': percentile(latencies, 0.90) * 1e3,
+            'p99': percentile(latencies, 0.99) * 1e3,
+            'max': max(latencies) * 1e3,
+            'mean': statistics.fmean(latencies) * 1e3,
+        },
+        'service': service_stats,
+    }
+
+
+async def main_async(args):
+    queries = make_queries(args.requests * args.batch, args.unique)
+    if args.url:
+        address = urlsplit(args.url)
+        return await run_load(address.hostname, address.port or 80, queries, args.concurrency, args.batch)
+    service = PathService(cache_size=args.cache_size, workers=args.workers, pool_threshold=args.pool_threshold)
+    server = await start_server(service, '127.0.0.1', 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    try:
+        return await run_load(host, port, queries, args.concurrency, args.batch)
+    finally:
+        server.close()
+        await server.wait_closed()
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help="service to load (default: start one in this process)")
+    parser.add_argument('-n', '--requests', type=int, default=5000)
+    parser.add_argument('-c', '--concurrency', type=int, default=32, help="open connections")
+    parser.add_argument('--batch', type=int, default=1, help="queries per request; >1 uses POST /batch")
+    parser.add_argument('--unique', type=float, default=0.1, help="share of queries with random weights")
+    parser.add_argument('--cache-size', type=int, default=1024, help="in-process server only")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="in-process server only")
+    parser.add_argument('--pool-threshold', type=int, default=64, help="in-process server only")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(main_async(args))
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
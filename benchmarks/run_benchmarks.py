@@ -0,0 +1,296 @@
+"""Benchmark harness for the path engine, the weight pipeline and the Demo handler.
+
+    python benchmarks/run_benchmarks.py                      # quick sizes, print JSON
+    python benchmarks/run_benchmarks.py --full -o out.json   # up to 1e6 edges / 1e7 rows
+    python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --only imports        # python -X importtime check
+
+Every case reports the median and best of several repeats. --compare
+checks the best-of timings (the least noisy) and exits with status 1 when
+a case is slower than the baseline by more than --tolerance. The imports
+group also fails when a sample-profile path query pulls in numpy or pandas.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pathfinder.bootstrap import bootstrap_paths  # noqa: E402
+from pathfinder.compiled_graph import internship_graph, internship_objective_matrices, internship_weight_matrix  # noqa: E402,E501
+from pathfinder.graph_store import load_graph, save_graph  # noqa: E402
+from pathfinder.internship_graph import ACTIVITY_NAMES, InternshipGraph, build_graph  # noqa: E402
+from pathfinder.sample_profiles import PERSONALITIES, get_sample_weights  # noqa: E402
+from pathfinder.survey_weights import PERSONALITY_COLUMN, compute_weights, score_columns  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SEED = 20251130
+
+# Modules timed with python -X importtime, each in a fresh interpreter
+IMPORT_MODULES = ['pathfinder', 'pathfinder.cli', 'pathfinder.service', 'pathfinder.report',
+                  'pathfinder.compiled_graph', 'pathfinder.survey_loader']
+HEAVY_MODULES = ('numpy', 'pandas')
+
+QUICK_EDGE_SIZES = [1_000, 10_000, 100_000]
+FULL_EDGE_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+QUICK_ROW_SIZES = [1_000, 10_000, 100_000]
+FULL_ROW_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def timeit(func, repeat, number=1):
+    # Per-call seconds; microsecond-scale cases run `number` calls per sample
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+    return {'seconds': statistics.median(samples), 'min': min(samples), 'repeat': repeat, 'number': number}
+
+
+# -------------------------
+# Synthetic inputs
+# -------------------------
+def layered_edges(n_edges, n_layers=8, seed=SEED):
+    # Fully connected consecutive layers, sized to roughly n_edges edges
+    rng = np.random.default_rng(seed)
+    width = max(1, int(round((n_edges / (n_layers - 1)) ** 0.5)))
+    edges = []
+    for layer in range(n_layers - 1):
+        weights = rng.uniform(0.1, 2.0, size=(width, width)).tolist()
+        for i in range(width):
+            for j in range(width):
+                edges.append(((layer, i), (layer + 1, j), weights[i][j]))
+    # Single source and sink so every query spans all layers
+    edges += [("Student", (0, i), 1.0) for i in range(width)]
+    edges += [((n_layers - 1, i), "Internship_Offer", 1.0) for i in range(width)]
+    return edges
+
+
+def synthetic_survey(n_rows, seed=SEED):
+    rng = np.random.default_rng(seed)
+    columns = {PERSONALITY_COLUMN: pd.Categorical.from_codes(rng.integers(0, 3, n_rows), PERSONALITIES)}
+    for col in score_columns():
+        values = rng.integers(1, 8, n_rows).astype(np.float32)
+        values[rng.random(n_rows) < 0.05] = np.nan
+        columns[col] = values
+    return pd.DataFrame(columns)
+
+
+# -------------------------
+# Cases
+# -------------------------
+def bench_stock_graph(results, repeat):
+    weights = get_sample_weights("Neutral")
+
+    def add_edges():
+        graph = InternshipGraph()
+        for i in range(10_000):
+            graph.add_edge(i, i + 1, 1.0)
+
+    results['add_edge/10k'] = timeit(add_edges, repeat)
+    results['build_graph/stock'] = timeit(lambda: build_graph(weights), repeat, number=1000)
+
+    # The dict heap search needs an unfrozen graph; a frozen one dispatches to the DAG pass
+    graph = build_graph(weights)
+    frozen = build_graph(weights).freeze()
+    results['dijkstra/stock'] = timeit(lambda: graph.dijkstra("Student", "Internship_Offer"), repeat, number=1000)
+    results['dijkstra/stock_frozen'] = timeit(lambda: frozen.dijkstra("Student", "Internship_Offer"), repeat,
+                                             number=1000)
+
+    def demo_handler():
+        # What Demo.py does on "Find My Optimal Path"
+        for personality in PERSONALITIES:
+            g = build_graph(get_sample_weights(personality))
+            g.dijkstra("Student", "Internship_Offer")
+            g.k_shortest_paths("Student", "Internship_Offer", 5)
+
+    results['demo_handler/3_personalities'] = timeit(demo_handler, repeat, number=50)
+
+    template = internship_graph()
+    rng = np.random.default_rng(SEED)
+    matrix = internship_weight_matrix(template, rng.uniform(0.2, 2.0, (10_000, len(ACTIVITY_NAMES))))
+    results['solve_batch/stock_10k_profiles'] = timeit(
+        lambda: template.solve_batch(matrix, "Student", "Internship_Offer"), repeat)
+    results['sensitivity_batch/stock_10k_profiles'] = timeit(
+        lambda: template.sensitivity_batch(matrix, "Student", "Internship_Offer"), repeat)
+    objectives = internship_objective_matrices(
+        template, [rng.uniform(1.0, 5.0, (10_000, len(ACTIVITY_NAMES))) for _ in range(3)])
+    results['pareto_batch/stock_10k_profiles'] = timeit(
+        lambda: template.pareto_batch(objectives, "Student", "Internship_Offer"), repeat)
+
+
+def bench_layered(results, sizes, repeat):
+    for n_edges in sizes:
+        edges = layered_edges(n_edges)
+        label = f"{n_edges:.0e}".replace('+0', '')
+
+        def build():
+            graph = InternshipGraph()
+            for from_node, to_node, weight in edges:
+                graph.add_edge(from_node, to_node, weight)
+            return graph
+
+        results[f'layered/{label}/build'] = timeit(build, repeat)
+        graph = build()
+        results[f'layered/{label}/freeze'] = timeit(lambda: _unfrozen(graph).freeze(), repeat)
+        frozen = _unfrozen(graph).freeze()
+        # Keep timing the dict heap search below, not the frozen DAG pass
+        _unfrozen(graph)
+        with tempfile.TemporaryDirectory() as directory:
+            image = os.path.join(directory, 'graph.img')
+            save_graph(frozen, image)
+            results[f'layered/{label}/load_image'] = timeit(lambda: load_graph(image), repeat)
+        results[f'layered/{label}/dijkstra'] = timeit(lambda: graph.dijkstra("Student", "Internship_Offer"), repeat)
+        results[f'layered/{label}/dijkstra_frozen'] = timeit(
+            lambda: frozen.dijkstra("Student", "Internship_Offer"), repeat)
+        for strategy in ('bidirectional', 'astar', 'alt'):
+            # First call builds the cached heuristic; time the queries that reuse it
+            graph.find_path("Student", "Internship_Offer", strategy)
+            results[f'layered/{label}/{strategy}'] = timeit(
+                lambda: graph.find_path("Student", "Internship_Offer", strategy), repeat)
+
+
+def _unfrozen(graph):
+    # freeze() caches its result; time the compilation itself
+    graph._compiled = None
+    return graph
+
+
+def bench_weights(results, sizes, repeat):
+    for n_rows in sizes:
+        survey = synthetic_survey(n_rows)
+        label = f"{n_rows:.0e}".replace('+0', '')
+        results[f'weights/{label}_rows'] = timeit(lambda: compute_weights(survey), repeat)
+        del survey
+    survey = synthetic_survey(300)
+    results['bootstrap/10k_replicates_300_rows'] = timeit(
+        lambda: bootstrap_paths(survey, replicates=10_000, seed=SEED), repeat)
+
+
+def import_time(module, repeat):
+    # Cumulative import time reported by python -X importtime
+    samples = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                              cwd=ROOT, capture_output=True, text=True, check=True)
+        for line in proc.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                samples.append(int(fields[1]) / 1e6)
+    return {'seconds': statistics.median(samples), 'min': min(samples), 'repeat': repeat, 'number': 1}
+
+
+def heavy_imports_for_path_query():
+    # numpy/pandas modules loaded by `Dijkstra.py path`; the stdlib core should load none
+    code = ("import contextlib, io, sys\n"
+            "from pathfinder.cli import main\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    main(['path', 'Neutral'])\n"
+            f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return proc.stdout.split()
+
+
+def bench_imports(results, repeat):
+    for module in IMPORT_MODULES:
+        results[f'import/{module}'] = import_time(module, repeat)
+    # Whole cold process, as an autoscaled replica would pay it
+    command = [sys.executable, os.path.join(ROOT, 'Dijkstra.py'), 'path', 'Neutral']
+    results['cold_start/path_query'] = timeit(lambda: subprocess.run(command, capture_output=True, check=True), repeat)
+
+
+def run(full=False, repeat=5, only=None):
+    results = {}
+    groups = {
+        'stock': lambda: bench_stock_graph(results, repeat),
+        'layered': lambda: bench_layered(results, FULL_EDGE_SIZES if full else QUICK_EDGE_SIZES, repeat),
+        'weights': lambda: bench_weights(results, FULL_ROW_SIZES if full else QUICK_ROW_SIZES, repeat),
+        'imports': lambda: bench_imports(results, repeat),
+    }
+    for name, bench in groups.items():
+        if only is None or name in only:
+            bench()
+    checks = {}
+    if only is None or 'imports' in only:
+        checks['path_query_heavy_imports'] = heavy_imports_for_path_query()
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'full': full,
+            'repeat': repeat,
+        },
+        'results': results,
+        'checks': checks,
+    }
+
+
+def compare(report, baseline, tolerance):
+    regressions = []
+    for name, current in report['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        ratio = current['min'] / reference['min'] if reference['min'] > 0 else float('inf')
+        marker = ''
+        if ratio > 1 + tolerance:
+            marker = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:40} {reference['min'] * 1e3:10.3f} ms -> {current['min'] * 1e3:10.3f} ms "
+              f"({ratio:5.2f}x){marker}", file=sys.stderr)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--full', action='store_true', help="include the 1e6-edge / 1e7-row sizes")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', nargs='+', choices=['stock', 'layered', 'weights', 'imports'])
+    parser.add_argument('-o', '--output', help="write JSON results here instead of stdout")
+    parser.add_argument('--compare', metavar='BASELINE', help="compare against a stored baseline JSON")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown ratio (default 0.25)")
+    parser.add_argument('--save-baseline', action='store_true', help=f"overwrite {os.path.relpath(BASELINE_PATH)}")
+    args = parser.parse_args(argv)
+
+    report = run(args.full, args.repeat, args.only)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    elif not args.save_baseline:
+        print(text)
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            f.write(text + '\n')
+
+    heavy = report['checks'].get('path_query_heavy_imports')
+    if heavy:
+        print(f"path query imported {', '.join(heavy)}; the solver core must stay stdlib-only", file=sys.stderr)
+        return 1
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed beyond {args.tolerance:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""Internship pathfinder.
+
+The graph core (InternshipGraph, build_graph, SearchStats) uses only the
+standard library. numpy and pandas are imported by the modules that need
+them: compiled_graph, shortest_paths and graph_store for the array engine,
+survey_weights and survey_loader for survey ingestion, batch_runner for
+batch scoring and bootstrap for resampled path stability.
+"""
+from .instrumentation import SearchStats
+from .internship_graph import (ACTIVITY_NAMES, APP_METHODS, INTERNSHIP_EDGES, LEARNING_METHODS, PARETO_OBJECTIVES,
+                               PROFILE_STEPS, SEARCH_STRATEGIES, InternshipGraph, build_graph)
@@ -0,0 +1,173 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .compiled_graph import internship_graph, internship_weight_matrix
+from .internship_graph import ACTIVITY_NAMES
+from .survey_loader import read_survey_chunks
+from .survey_weights import ACADEMIC_LEVEL_COLUMN, PERSONALITY_COLUMN, respondent_weights
+
+SUBMISSION_ID_COLUMN = 'Submission ID'
+DEFAULT_BATCH_CHUNKSIZE = 50_000
+
+# Frozen topology, built once per worker process
+_graph = None
+
+
+# -------------------------
+# Scoring
+# -------------------------
+def score_chunk(chunk, source=''):
+    """Per-respondent weights, optimal path and cost for one chunk of survey rows."""
+    global _graph
+    if _graph is None:
+        _graph = internship_graph()
+    weights = respondent_weights(chunk)
+    weight_matrix = internship_weight_matrix(_graph, weights[ACTIVITY_NAMES].to_numpy())
+    paths, costs = _graph.solve_batch(weight_matrix, "Student", "Internship_Offer")
+
+    if SUBMISSION_ID_COLUMN in chunk.columns:
+        respondent = chunk[SUBMISSION_ID_COLUMN].to_numpy()
+    else:
+        respondent = chunk.index.to_numpy()
+    return pd.DataFrame({
+        'source': source,
+        'respondent': respondent,
+        'academic_level': chunk[ACADEMIC_LEVEL_COLUMN].astype(object).to_numpy(),
+        'personality': chunk[PERSONALITY_COLUMN].astype(object).to_numpy(),
+        'cost': costs,
+        'path': [' → '.join(path) for path in paths],
+        'learning_method': [path[1] if len(path) > 1 else None for path in paths],
+        'application_method': [path[4] if len(path) > 4 else None for path in paths],
+    })
+
+
+def respondent_chunks(paths, chunksize=DEFAULT_BATCH_CHUNKSIZE):
+    # Yields (file name, chunk); a file with free-text scores is restarted in
+    # text mode, skipping the rows that were already yielded
+    for path in paths:
+        done = 0
+        try:
+            for chunk in read_survey_chunks(path, chunksize=chunksize, extra_columns=[SUBMISSION_ID_COLUMN]):
+                done += len(chunk)
+                yield os.path.basename(path), chunk
+        except ValueError:
+            skip = done
+            for chunk in read_survey_chunks(path, chunksize=chunksize, compact_scores=False,
+                                            extra_columns=[SUBMISSION_ID_COLUMN]):
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                yield os.path.basename(path), chunk.iloc[skip:]
+                skip = 0
+
+
+# -------------------------
+# Output
+# -------------------------
+class CsvResultWriter:
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.header = True
+
+    def write(self, frame):
+        frame.to_csv(self.file, header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetResultWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("Parquet output needs pyarrow; install it or write a .csv file instead") from exc
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        self.writer = None
+
+    def write(self, frame):
+        table = self._pa.Table.from_pandas(frame, preserve_index=False)
+        if self.writer is None:
+            self.writer = self._pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_writer(path, fmt=None):
+    fmt = fmt or ('parquet' if path.endswith('.parquet') else 'csv')
+    if fmt == 'parquet':
+        return ParquetResultWriter(path)
+    if fmt == 'csv':
+        return CsvResultWriter(path)
+    raise ValueError(f"unknown output format: {fmt!r}")
+
+
+# -------------------------
+# Runner
+# -------------------------
+def run_batch(paths, output, workers=None, chunksize=DEFAULT_BATCH_CHUNKSIZE, fmt=None, log=sys.stderr):
+    """Score every respondent of the given exports; returns (rows, seconds)."""
+    workers = workers or os.cpu_count() or 1
+    writer = open_writer(output, fmt)
+    started = time.perf_counter()
+    rows = 0
+    try:
+        if workers == 1:
+            for source, chunk in respondent_chunks(paths, chunksize):
+                frame = score_chunk(chunk, source)
+                writer.write(frame)
+                rows += len(frame)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Bounded in-flight work keeps memory flat; results are written in input order
+                pending = deque()
+                for source, chunk in respondent_chunks(paths, chunksize):
+                    pending.append(pool.submit(score_chunk, chunk, source))
+                    if len(pending) >= 2 * workers:
+                        frame = pending.popleft().result()
+                        writer.write(frame)
+                        rows += len(frame)
+                while pending:
+                    frame = pending.popleft().result()
+                    writer.write(frame)
+                    rows += len(frame)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+    if log is not None:
+        rate = rows / elapsed if elapsed > 0 else float('inf')
+        print(f"Scored {rows} respondents in {elapsed:.2f}s ({rate:,.0f} rows/sec, {workers} workers)", file=log)
+    return rows, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='Dijkstra.py batch',
+                                     description="Score every survey respondent's optimal internship path.")
+    parser.add_argument('csv', nargs='+', help="Fillout survey export(s)")
+    parser.add_argument('-o', '--output', required=True, help="output .csv or .parquet file")
+    parser.add_argument('--format', choices=['csv', 'parquet'], help="override the format implied by --output")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_BATCH_CHUNKSIZE, help="rows per work unit")
+    args = parser.parse_args(argv)
+    try:
+        run_batch(args.csv, args.output, args.workers, args.chunksize, args.format)
+    except RuntimeError as exc:
+        parser.exit(2, f"error: {exc}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .compiled_graph import internship_graph, internship_weight_matrix
+from .internship_graph import ACTIVITY_NAMES
+from .survey_weights import (ACTIVITIES, PERSONALITY_COLUMN, group_codes, means_from_sums, score_matrix,
+                             weights_from_means)
+
+DEFAULT_REPLICATES = 1000
+DEFAULT_CONFIDENCE = 0.95
+# Replicates per work unit are capped so a block's (replicates x respondents)
+# resampling counts stay around 32 MB
+MAX_BLOCK_CELLS = 4_000_000
+
+# Frozen topology, built once per worker process
+_graph = None
+
+
+# -------------------------
+# Resampling
+# -------------------------
+def resample_weights(scores, columns, counts, activities=ACTIVITIES):
+    """Weights table with one row per replicate.
+
+    scores is the (respondents x score columns) matrix of one group, NaN where
+    unanswered; counts[b, i] is how often replicate b draws respondent i.
+    """
+    answered = ~np.isnan(scores)
+    sums = counts @ np.where(answered, scores, 0.0)
+    totals = counts @ answered.astype(np.float64)
+    return weights_from_means(means_from_sums(sums, totals, pd.RangeIndex(len(counts)), columns), activities)
+
+
+def replicate_block(scores, columns, replicates, seed, path_edges, activities=ACTIVITIES):
+    """Optimal paths and costs for `replicates` multinomial resamples of one group.
+
+    Returns (paths joined with ' → ', optimal costs, costs of the path given
+    by path_edges under each replicate's weights).
+    """
+    global _graph
+    if _graph is None:
+        _graph = internship_graph()
+    rng = np.random.default_rng(seed)
+    n = len(scores)
+    counts = rng.multinomial(n, np.full(n, 1.0 / n), size=replicates).astype(np.float64)
+    weights = resample_weights(scores, columns, counts, activities)
+    W = internship_weight_matrix(_graph, weights[ACTIVITY_NAMES].to_numpy())
+    paths, costs = _graph.solve_batch(W, "Student", "Internship_Offer")
+    return [' → '.join(path) for path in paths], costs, W[:, path_edges].sum(axis=1)
+
+
+# -------------------------
+# Runner
+# -------------------------
+def bootstrap_paths(df, by=PERSONALITY_COLUMN, replicates=DEFAULT_REPLICATES, confidence=DEFAULT_CONFIDENCE,
+                    seed=None, workers=1, activities=ACTIVITIES):
+    """Resample respondents within each group of `by` and re-solve the optimal path per replicate.
+
+    Returns (summary, wins). summary has one row per group: the full-sample
+    path and cost, the share of replicates that path wins, and confidence
+    intervals on the optimal cost and on the full-sample path's cost. wins
+    lists every path that won a replicate with its share per group. Results
+    depend on seed, not on workers.
+    """
+    if replicates < 1:
+        raise ValueError(f"replicates must be at least 1, got {replicates}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+    graph = internship_graph()
+    scores = score_matrix(df, activities)
+    columns = scores.columns
+    values = scores.to_numpy()
+    codes, index = group_codes(df, by)
+
+    groups = []
+    for g, label in enumerate(index):
+        group_scores = values[codes == g]
+        if len(group_scores) == 0:
+            continue
+        n = len(group_scores)
+        counts = np.ones((1, n))
+        weights = resample_weights(group_scores, columns, counts, activities)
+        (path,), (cost,) = graph.solve_batch(internship_weight_matrix(graph, weights[ACTIVITY_NAMES].to_numpy()),
+                                             "Student", "Internship_Offer")
+        path_edges = [graph.edge_id(u, v) for u, v in zip(path, path[1:])]
+        groups.append((label, group_scores, path, cost, path_edges))
+
+    # Fixed block sizes and per-block seeds keep the draws independent of workers
+    units = []
+    for (label, group_scores, _, _, path_edges), group_seed in zip(
+            groups, np.random.SeedSequence(seed).spawn(len(groups))):
+        block = max(1, MAX_BLOCK_CELLS // len(group_scores))
+        sizes = [min(block, replicates - start) for start in range(0, replicates, block)]
+        for size, block_seed in zip(sizes, group_seed.spawn(len(sizes))):
+            units.append((label, (group_scores, columns, size, block_seed, path_edges, activities)))
+
+    if workers == 1:
+        outputs = [replicate_block(*args) for _, args in units]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = [pool.submit(replicate_block, *args) for _, args in units]
+            outputs = [future.result() for future in futures]
+
+    by_group = {}
+    for (label, _), (paths, costs, path_costs) in zip(units, outputs):
+        parts = by_group.setdefault(label, ([], [], []))
+        parts[0].extend(paths)
+        parts[1].append(costs)
+        parts[2].append(path_costs)
+
+    alpha = (1.0 - confidence) / 2
+    rows = []
+    win_rows = []
+    for label, group_scores, path, cost, _ in groups:
+        paths, costs, path_costs = by_group[label]
+        costs = np.concatenate(costs)
+        path_costs = np.concatenate(path_costs)
+        shares = pd.Series(paths).value_counts(normalize=True)
+        cost_low, cost_high = np.quantile(costs, [alpha, 1 - alpha])
+        path_low, path_high = np.quantile(path_costs, [alpha, 1 - alpha])
+        rows.append({
+            'respondents': len(group_scores),
+            'replicates': len(costs),
+            'path': ' → '.join(path),
+            'cost': cost,
+            'path_share': shares.get(' → '.join(path), 0.0),
+            'cost_low': cost_low,
+            'cost_high': cost_high,
+            'path_cost_low': path_low,
+            'path_cost_high': path_high,
+        })
+        win_rows += [{'group': label, 'path': p, 'share': share} for p, share in shares.items()]
+    summary = pd.DataFrame(rows, index=pd.Index([g[0] for g in groups], name=index.name))
+    return summary, pd.DataFrame(win_rows, columns=['group', 'path', 'share'])
+
+
+def load_responses(paths):
+    # Respondent-level rows of every export, as read for batch scoring
+    from .batch_runner import respondent_chunks
+    return pd.concat([chunk for _, chunk in respondent_chunks(paths)], ignore_index=True)
@@ -0,0 +1,121 @@
+import argparse
+import sys
+
+from .instrumentation import SearchStats
+from .internship_graph import SEARCH_STRATEGIES, build_graph
+from .sample_profiles import PERSONALITIES, get_sample_hours, get_sample_weights
+
+
+# -------------------------
+# Commands
+# -------------------------
+def path_main(argv):
+    # Sample-profile query on the stdlib core; numpy and pandas are never imported
+    parser = argparse.ArgumentParser(prog='Dijkstra.py path',
+                                     description="Optimal path for one of the sample personality profiles.")
+    parser.add_argument('personality', choices=PERSONALITIES)
+    parser.add_argument('--strategy', choices=SEARCH_STRATEGIES, default='dijkstra')
+    parser.add_argument('--budget', type=float, help="hours available; picks the cheapest path that fits")
+    args = parser.parse_args(argv)
+
+    graph = build_graph(get_sample_weights(args.personality), hours=get_sample_hours(args.personality))
+    if args.budget is None:
+        path, cost = graph.find_path("Student", "Internship_Offer", args.strategy)
+    else:
+        path, cost, _ = graph.constrained_path("Student", "Internship_Offer", args.budget)
+    if not path:
+        print(f"No path fits in {args.budget:g} hours")
+        return 1
+    print(f"Optimal Path: {' → '.join(path)}")
+    print(f"Total Cost: {cost:.3f}")
+    return 0
+
+
+def report_main(argv):
+    parser = argparse.ArgumentParser(
+        description="Optimal internship paths per personality. "
+                    "Use 'batch' to score every respondent, 'path' for a quick sample-profile query "
+                    "or 'serve' for the HTTP service."
+    )
+    parser.add_argument('csv', nargs='*', help="Fillout survey export(s) (default: the bundled export)")
+    parser.add_argument('--stats', choices=['prometheus', 'json'],
+                        help="print pipeline timings to stderr in this format")
+    args = parser.parse_args(argv)
+
+    # The survey pipeline is the first thing that needs pandas
+    from .report import DEFAULT_CSV, report
+    stats = SearchStats() if args.stats else None
+    report(args.csv or [DEFAULT_CSV], stats)
+    if args.stats == 'prometheus':
+        sys.stderr.write(stats.to_prometheus())
+    elif args.stats == 'json':
+        print(stats.to_json_line(command='report'), file=sys.stderr)
+    return 0
+
+
+def bootstrap_main(argv):
+    parser = argparse.ArgumentParser(prog='Dijkstra.py bootstrap',
+                                     description="How stable each personality's optimal path is under resampling.")
+    parser.add_argument('csv', nargs='*', help="Fillout survey export(s) (default: the bundled export)")
+    parser.add_argument('-B', '--replicates', type=int, default=10_000, help="bootstrap replicates per personality")
+    parser.add_argument('--confidence', type=float, default=0.95, help="confidence level of the cost intervals")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible replicates")
+    parser.add_argument('-j', '--workers', type=int, default=1, help="worker processes (0: all cores)")
+    args = parser.parse_args(argv)
+    if args.replicates < 1:
+        parser.error("--replicates must be at least 1")
+    if not 0 < args.confidence < 1:
+        parser.error("--confidence must be between 0 and 1")
+
+    from .bootstrap import bootstrap_paths, load_responses
+    from .report import DEFAULT_CSV
+    summary, wins = bootstrap_paths(load_responses(args.csv or [DEFAULT_CSV]), replicates=args.replicates,
+                                    confidence=args.confidence, seed=args.seed, workers=args.workers)
+    level = f"{args.confidence:.0%}"
+    for personality in [p for p in PERSONALITIES if p in summary.index]:
+        row = summary.loc[personality]
+        print(f"\n {personality.upper()} STUDENTS ({row['respondents']} respondents, {row['replicates']} replicates):")
+        print(f"Optimal Path: {row['path']}")
+        print(f"Total Cost: {row['cost']:.3f} "
+              f"(this path {level} CI {row['path_cost_low']:.3f}-{row['path_cost_high']:.3f}, "
+              f"optimal cost {level} CI {row['cost_low']:.3f}-{row['cost_high']:.3f})")
+        print(f"Wins {row['path_share']:.1%} of replicates. Most frequent winners:")
+        for _, win in wins[wins['group'] == personality].head(5).iterrows():
+            print(f"  {win['share']:6.1%}  {win['path']}")
+    return 0
+
+
+def serve_main(argv):
+    import asyncio
+
+    from .service import DEFAULT_CACHE_SIZE, DEFAULT_HOST, DEFAULT_POOL_THRESHOLD, DEFAULT_PORT, serve
+    parser = argparse.ArgumentParser(prog='Dijkstra.py serve', description="JSON path-query service over HTTP.")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('-j', '--workers', type=int, default=None, help="batch pool processes (default: all cores)")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE, help="recent results kept (0 disables)")
+    parser.add_argument('--pool-threshold', type=int, default=DEFAULT_POOL_THRESHOLD,
+                        help="batches this large are solved in the process pool")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, cache_size=args.cache_size, workers=args.workers,
+                          pool_threshold=args.pool_threshold))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == 'batch':
+        from .batch_runner import main as batch_main
+        return batch_main(argv[1:])
+    if argv and argv[0] == 'path':
+        return path_main(argv[1:])
+    if argv and argv[0] == 'bootstrap':
+        return bootstrap_main(argv[1:])
+    if argv and argv[0] == 'serve':
+        return serve_main(argv[1:])
+    if argv and argv[0] == 'report':
+        argv = argv[1:]
+    return report_main(argv)
@@ -0,0 +1,682 @@
+import heapq
+import time
+from functools import cached_property
+
+import numpy as np
+
+from .internship_graph import (ACTIVITY_NAMES, APP_METHODS, INTERNSHIP_EDGES, LEARNING_METHODS, PROFILE_STEPS,
+                               build_graph)
+from .shortest_paths import (FLOYD_WARSHALL_MAX_NODES, AllPairsShortestPaths, ShortestPathTree, dijkstra_trees,
+                             floyd_warshall)
+
+# pareto_batch() enumerates every start-end path; beyond this, solve profiles one by one
+MAX_PARETO_PATHS = 100_000
+# Every stock path takes exactly one activity from each stage
+INTERNSHIP_STAGES = (LEARNING_METHODS, PROFILE_STEPS, APP_METHODS, ['Interview'])
+
+
+# -------------------------
+# Frozen CSR graph engine
+# -------------------------
+class CompiledGraph:
+    """Immutable graph with interned node ids and CSR adjacency arrays."""
+
+    def __init__(self, nodes, offsets, targets, weights, topological_order=None):
+        self.nodes = list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        # May be read-only memory maps of a graph image (see graph_store.py)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self._trees = {}
+        # Image file the arrays are mapped from, set by graph_store.load_graph()
+        self.image_path = None
+
+        # Topological order if the graph is acyclic, else None; searches on a
+        # DAG use one linear relaxation pass instead of the heap. A stored
+        # order (from a graph image) skips the sort.
+        if topological_order is None:
+            self.topological_order = self._topological_sort()
+        else:
+            self.topological_order = np.asarray(topological_order).tolist()
+
+    # Element access on NumPy arrays is slow from Python, so the scalar
+    # search loop runs over list views of the same CSR data. They are built
+    # on first use so a memory-mapped graph stays shared until then.
+    @cached_property
+    def _offsets(self):
+        return self.offsets.tolist()
+
+    @cached_property
+    def _targets(self):
+        return self.targets.tolist()
+
+    @cached_property
+    def _weights(self):
+        return self.weights.tolist()
+
+    @cached_property
+    def _rank(self):
+        rank = [0] * self.num_nodes
+        for position, u in enumerate(self.topological_order):
+            rank[u] = position
+        return rank
+
+    @cached_property
+    def _name_rank(self):
+        # Node ids ranked by name, for batch tie-breaking; id order if names don't compare
+        try:
+            order = sorted(range(self.num_nodes), key=self.nodes.__getitem__)
+        except TypeError:
+            order = range(self.num_nodes)
+        rank = np.empty(self.num_nodes, dtype=np.int64)
+        rank[list(order)] = np.arange(self.num_nodes)
+        return rank
+
+    @cached_property
+    def _name_rank_list(self):
+        return self._name_rank.tolist()
+
+    @cached_property
+    def _has_zero_weight(self):
+        return 0.0 in self._weights
+
+    # Preallocated per-query state, reset in place on every search
+    @cached_property
+    def _inf(self):
+        return [float('inf')] * self.num_nodes
+
+    @cached_property
+    def _no_prev(self):
+        return [-1] * self.num_nodes
+
+    @cached_property
+    def _dist(self):
+        return [float('inf')] * self.num_nodes
+
+    @cached_property
+    def _prev(self):
+        return [-1] * self.num_nodes
+
+    @classmethod
+    def from_edges(cls, edges):
+        # edges is the {from_node: {to_node: weight}} dict of InternshipGraph
+        nodes = list(edges)
+        index = {node: i for i, node in enumerate(nodes)}
+        offsets = [0]
+        targets = []
+        weights = []
+        for node in nodes:
+            for neighbor, weight in edges[node].items():
+                targets.append(index[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(nodes, offsets, targets, weights)
+
+    @property
+    def num_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @property
+    def is_dag(self):
+        return self.topological_order is not None
+
+    def node_id(self, node):
+        return self.index[node]
+
+    def edge_id(self, from_node, to_node):
+        u = self.index[from_node]
+        v = self.index[to_node]
+        for e in range(self._offsets[u], self._offsets[u + 1]):
+            if self._targets[e] == v:
+                return e
+        raise KeyError((from_node, to_node))
+
+    def dijkstra(self, start, end, stats=None):
+        # stats (a SearchStats) gets search/reconstruct timings and, for the
+        # topological pass, the settled nodes and scanned edges; it uses no heap
+        source = self.index[start]
+        target = self.index[end]
+        if stats is None:
+            self._search(source, target)
+            return self._reconstruct(source, target, self._prev, self._dist)
+        started = time.perf_counter()
+        self._search(source, target)
+        searched = time.perf_counter()
+        result = self._reconstruct(source, target, self._prev, self._dist)
+        stats.record('search', searched - started)
+        stats.record('reconstruct', time.perf_counter() - searched)
+        stats.add(searches=1, **self._dag_counts(source, target))
+        return result
+
+    def _dag_counts(self, source, target):
+        # Nodes the last _dag_search() expanded and the edges it scanned from them
+        if self.topological_order is None or self._has_zero_weight:
+            return {}
+        offsets = self._offsets
+        dist = self._dist
+        inf = float('inf')
+        expanded = [u for u in self.topological_order[self._rank[source]:self._rank[target]] if dist[u] != inf]
+        return {'nodes_settled': len(expanded) + 1,
+                'edges_scanned': sum(offsets[u + 1] - offsets[u] for u in expanded)}
+
+    def _search(self, source, target=-1):
+        # Fills the preallocated dist/prev buffers from source; with a target,
+        # only the entries on its shortest path are guaranteed final
+        if self.topological_order is not None and not self._has_zero_weight:
+            self._dag_search(source, target)
+        else:
+            self._heap_search(source, target)
+
+    def _dag_search(self, source, target=-1):
+        # O(V + E) relaxation in topological order. Nodes ranked after target
+        # cannot reach it. Ties go to the predecessor a heap search would pop
+        # first, so results match InternshipGraph.dijkstra(): by distance, then
+        # by name. A zero-weight edge can push a node at its predecessor's
+        # distance after that predecessor was popped, which breaks this order;
+        # _search() sends such graphs to the heap instead
+        offsets = self._offsets
+        targets = self._targets
+        weights = self._weights
+        nodes = self.nodes
+        dist = self._dist
+        prev = self._prev
+        dist[:] = self._inf
+        prev[:] = self._no_prev
+        dist[source] = 0.0
+        inf = float('inf')
+        order = self.topological_order
+        stop = len(order) if target < 0 else self._rank[target]
+
+        for u in order[self._rank[source]:stop]:
+            current_dist = dist[u]
+            if current_dist == inf:
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                distance = current_dist + weights[e]
+                if distance < dist[v]:
+                    dist[v] = distance
+                    prev[v] = u
+                elif distance == dist[v] and prev[v] >= 0:
+                    p = prev[v]
+                    if (current_dist, nodes[u]) < (dist[p], nodes[p]):
+                        prev[v] = u
+
+    def _heap_search(self, source, target=-1, weights=None):
+        # Heap Dijkstra; stops once target is popped. Equal distances pop by
+        # node name, as in InternshipGraph.dijkstra(). weights overrides the
+        # graph's edge weights (a list in CSR order)
+        offsets = self._offsets
+        targets = self._targets
+        weights = self._weights if weights is None else weights
+        name_rank = self._name_rank_list
+        dist = self._dist
+        prev = self._prev
+        dist[:] = self._inf
+        prev[:] = self._no_prev
+        dist[source] = 0.0
+        pq = [(0.0, name_rank[source], source)]
+
+        while pq:
+            current_dist, _, u = heapq.heappop(pq)
+
+            if u == target:
+                break
+
+            if current_dist > dist[u]:
+                continue
+
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                distance = current_dist + weights[e]
+                if distance < dist[v]:
+                    dist[v] = distance
+                    prev[v] = u
+                    heapq.heappush(pq, (distance, name_rank[v], v))
+
+    # -------------------------
+    # One-to-all and all-pairs queries
+    # -------------------------
+    def shortest_path_tree(self, start):
+        """Distances and predecessors from start to every node, cached per source."""
+        source = self.index[start]
+        if source not in self._trees:
+            self._search(source)
+            self._trees[source] = ShortestPathTree(self, source, self._dist, self._prev)
+        return self._trees[source]
+
+    def all_pairs(self, method='auto', workers=None):
+        """All-pairs distances: Floyd-Warshall for small graphs, parallel Dijkstra otherwise."""
+        if method == 'auto':
+            method = 'floyd_warshall' if self.num_nodes <= FLOYD_WARSHALL_MAX_NODES else 'dijkstra'
+        if method == 'floyd_warshall':
+            dist, prev = floyd_warshall(self)
+        elif method == 'dijkstra':
+            missing = [u for u in range(self.num_nodes) if u not in self._trees]
+            for source, tree in zip(missing, dijkstra_trees(self, missing, workers)):
+                self._trees[source] = tree
+            dist = np.stack([self._trees[u].dist for u in range(self.num_nodes)])
+            prev = np.stack([self._trees[u].prev for u in range(self.num_nodes)])
+        else:
+            raise ValueError(f"unknown all-pairs method: {method!r}")
+        return AllPairsShortestPaths(self, dist, prev)
+
+    def solve_batch(self, weight_matrix, start, end):
+        """Solve one shortest path per row of an (N_profiles x N_edges) weight matrix.
+
+        Runs a dynamic-programming sweep over the DAG layers, vectorized over
+        profiles. Returns (paths, costs) with paths as lists of node names;
+        equal-cost ties resolve like dijkstra().
+        """
+        W = self._batch_weights(weight_matrix)
+        source = self.index[start]
+        target = self.index[end]
+        dist, pred = self._forward_batch(W, source, target)
+        costs = dist[:, target]
+        return self._reconstruct_batch(source, target, pred, costs), costs
+
+    def sensitivity_batch(self, weight_matrix, start, end):
+        """Per-edge weight ranges over which each profile's optimal path stays optimal.
+
+        Returns (paths, costs, lower, upper) with lower and upper (N, E): the
+        path stays optimal while one edge weight stays in [lower, upper] and
+        the others are fixed; -inf and inf mean unbounded. Off-path edges may
+        drop by their slack, D minus the best path through them; on-path
+        edges may rise until the best path avoiding them ties. Both come from
+        forward and reverse distance sweeps, with no search per edge.
+        """
+        W = self._batch_weights(weight_matrix)
+        source = self.index[start]
+        target = self.index[end]
+        n_profiles = W.shape[0]
+        rows = np.arange(n_profiles)[:, np.newaxis]
+        layer_of, layers = self._layers()
+        out_layers = self._out_layers()
+        edge_sources = self._edge_sources()
+        edge_targets = self.targets
+
+        dist, pred = self._forward_batch(W, source, target)
+        costs = dist[:, target]
+        paths = self._reconstruct_batch(source, target, pred, costs)
+
+        # Distances to target and the first edge of each node's shortest path there
+        to_target = np.full((n_profiles, self.num_nodes), np.inf)
+        succ = np.full((n_profiles, self.num_nodes), -1, dtype=np.int64)
+        to_target[:, target] = 0.0
+        for nodes, out_edges, mask in out_layers[layer_of[source]:layer_of[target]][::-1]:
+            cand = np.where(mask, W[:, out_edges] + to_target[:, edge_targets[out_edges]], np.inf)
+            best = cand.argmin(axis=2)
+            best_dist = np.take_along_axis(cand, best[:, :, np.newaxis], axis=2)[:, :, 0]
+            to_target[:, nodes] = best_dist
+            succ[:, nodes] = np.where(np.isfinite(best_dist), out_edges[np.arange(len(nodes)), best], -1)
+
+        # Edges of each optimal path by position, and every node's position on it
+        path_edges = self._path_edges(source, target, pred, costs)
+        length = (path_edges >= 0).sum(axis=1)
+        on_path = np.zeros((n_profiles, self.num_edges), dtype=bool)
+        position = np.full((n_profiles, self.num_nodes), -1, dtype=np.int64)
+        position[np.isfinite(costs), source] = 0
+        for i, edges in enumerate(path_edges.T):
+            has = edges >= 0
+            on_path[has, edges[has]] = True
+            position[has, edge_targets[edges[has]]] = i + 1
+
+        # leaves[v]: last path position on the shortest path from source to v;
+        # joins[v]: first path position on the shortest path from v to target
+        leaves = np.where(position >= 0, position, 0)
+        for nodes, _, _ in layers[layer_of[source] + 1:layer_of[target] + 1]:
+            parent = edge_sources[np.maximum(pred[:, nodes], 0)]
+            leaves[:, nodes] = np.where(position[:, nodes] >= 0, position[:, nodes], leaves[rows, parent])
+        joins = np.where(position >= 0, position, 0)
+        for nodes, _, _ in out_layers[layer_of[source]:layer_of[target]][::-1]:
+            child = edge_targets[np.maximum(succ[:, nodes], 0)]
+            joins[:, nodes] = np.where(position[:, nodes] >= 0, position[:, nodes], joins[rows, child])
+
+        # Cheapest source-target path through each edge
+        through = dist[:, edge_sources] + W + to_target[:, edge_targets]
+        reached = np.isfinite(costs)[:, np.newaxis]
+        with np.errstate(invalid='ignore'):
+            slack = np.maximum(through - costs[:, np.newaxis], 0.0)
+        lower = np.where(on_path | ~reached, -np.inf, W - slack)
+        upper = np.full_like(W, np.inf)
+
+        # Avoiding path edge i means taking some off-path edge (x, y) with
+        # leaves[x] <= i < joins[y]; its best such detour bounds edge i
+        bypass = np.where(on_path, np.inf, through)
+        leaves_from = leaves[:, edge_sources]
+        joins_to = joins[:, edge_targets]
+        for i in range(path_edges.shape[1]):
+            detour = np.where((leaves_from <= i) & (joins_to > i), bypass, np.inf).min(axis=1)
+            has = i < length
+            edges = path_edges[has, i]
+            upper[has, edges] = W[has, edges] + detour[has] - costs[has]
+        return paths, costs, lower, upper
+
+    def pareto_batch(self, objective_matrices, start, end, max_paths=MAX_PARETO_PATHS):
+        """Pareto fronts for many profiles at once.
+
+        objective_matrices is (K, N_profiles, N_edges), one weight matrix per
+        objective. The DAG's start-end paths are enumerated once and shared.
+        Returns (paths, costs, front): costs is (N, P, K), and front[n, p] marks
+        the non-dominated paths of profile n, one per distinct cost vector.
+        """
+        O = np.asarray(objective_matrices, dtype=np.float64)
+        if O.ndim == 2:
+            O = O[:, np.newaxis, :]
+        if O.ndim != 3 or O.shape[2] != self.num_edges:
+            raise ValueError(f"expected a (K, N, {self.num_edges}) objective array, got shape {O.shape}")
+        if not self.is_dag:
+            raise ValueError("graph has a cycle; pareto_batch needs a DAG")
+        edge_paths = self._enumerate_paths(self.index[start], self.index[end], max_paths)
+        incidence = np.zeros((len(edge_paths), self.num_edges))
+        for p, edges in enumerate(edge_paths):
+            incidence[p, edges] = 1.0
+        costs = np.einsum('kne,pe->npk', O, incidence)
+
+        n_profiles, n_paths, k = costs.shape
+        front = np.ones((n_profiles, n_paths), dtype=bool)
+        # Pairwise dominance over P x P x K, a block of profiles at a time
+        block = max(1, 2 ** 23 // max(1, n_paths * n_paths * k))
+        earlier = np.tri(n_paths, k=-1, dtype=bool)  # earlier[p, q]: q < p keeps the first of equal vectors
+        for lo in range(0, n_profiles, block):
+            c = costs[lo:lo + block]
+            no_worse = (c[:, np.newaxis, :, :] <= c[:, :, np.newaxis, :]).all(axis=3)
+            better = (c[:, np.newaxis, :, :] < c[:, :, np.newaxis, :]).any(axis=3)
+            front[lo:lo + block] = ~(no_worse & (better | earlier)).any(axis=2)
+
+        edge_sources = self._edge_sources()
+        paths = [[self.nodes[edge_sources[edges[0]]]] + [self.nodes[self._targets[e]] for e in edges]
+                 for edges in edge_paths]
+        return paths, costs, front
+
+    def _enumerate_paths(self, source, target, max_paths):
+        # Depth-first over edges that can still reach target; paths as edge id lists
+        reaches = {target}
+        for u in reversed(self.topological_order):
+            if any(v in reaches for v in self._targets[self._offsets[u]:self._offsets[u + 1]]):
+                reaches.add(u)
+        if source not in reaches or source == target:
+            return []
+        paths = []
+        stack = [(source, [])]
+        while stack:
+            u, edges = stack.pop()
+            for e in range(self._offsets[u + 1] - 1, self._offsets[u] - 1, -1):
+                v = self._targets[e]
+                if v == target:
+                    paths.append(edges + [e])
+                    if len(paths) > max_paths:
+                        raise ValueError(f"more than {max_paths} paths; use InternshipGraph.pareto_paths per profile")
+                elif v in reaches:
+                    stack.append((v, edges + [e]))
+        return paths
+
+    def _batch_weights(self, weight_matrix):
+        W = np.asarray(weight_matrix, dtype=np.float64)
+        if W.ndim == 1:
+            W = W[np.newaxis, :]
+        if W.ndim != 2 or W.shape[1] != self.num_edges:
+            raise ValueError(f"expected a (N, {self.num_edges}) weight matrix, got shape {W.shape}")
+        return W
+
+    def _forward_batch(self, W, source, target):
+        # Dynamic-programming sweep over the DAG layers, vectorized over profiles;
+        # (dist, pred) with pred the incoming edge of each node's shortest path
+        n_profiles = W.shape[0]
+        layer_of, layers = self._layers()
+        edge_sources = self._edge_sources()
+
+        dist = np.full((n_profiles, self.num_nodes), np.inf)
+        pred = np.full((n_profiles, self.num_nodes), -1, dtype=np.int64)
+        dist[:, source] = 0.0
+
+        # Only layers between the source and the target can change anything
+        for nodes, in_edges, mask in layers[layer_of[source] + 1:layer_of[target] + 1]:
+            cand = dist[:, edge_sources[in_edges]] + W[:, in_edges]
+            cand = np.where(mask, cand, np.inf)
+            best = cand.argmin(axis=2)
+            best_dist = np.take_along_axis(cand, best[:, :, np.newaxis], axis=2)[:, :, 0]
+            reached = np.isfinite(best_dist)
+            tied = cand == best_dist[:, :, np.newaxis]
+            if (tied.sum(axis=2) > 1).any():
+                # Same rule as _dag_search(): the predecessor a heap search would
+                # pop first, by distance and then by node name
+                from_dist = np.where(tied, dist[:, edge_sources[in_edges]], np.inf)
+                tied &= from_dist == from_dist.min(axis=2, keepdims=True)
+                best = np.where(tied, self._name_rank[edge_sources[in_edges]], self.num_nodes).argmin(axis=2)
+            dist[:, nodes] = best_dist
+            pred[:, nodes] = np.where(reached, in_edges[np.arange(len(nodes)), best], -1)
+
+        # As in _dag_search(), a zero-length shortest-path edge breaks the
+        # (distance, name) order; replay the heap for the rows that have one
+        with np.errstate(invalid='ignore'):
+            from_dist = dist[:, edge_sources]
+            flat = (np.isfinite(from_dist) & (from_dist == dist[:, self.targets])
+                    & (from_dist + W == from_dist)).any(axis=1)
+        for row in np.flatnonzero(flat).tolist():
+            self._heap_search(source, -1, W[row].tolist())
+            for v in np.flatnonzero(np.isfinite(dist[row])).tolist():
+                u = self._prev[v]
+                if u >= 0:
+                    pred[row, v] = self._offsets[u] + self._targets[self._offsets[u]:self._offsets[u + 1]].index(v)
+        return dist, pred
+
+    def _path_edges(self, source, target, pred, costs):
+        # (N, L) edge ids of each profile's path in order, padded with -1
+        n_profiles = pred.shape[0]
+        rows = np.arange(n_profiles)
+        edge_sources = self._edge_sources()
+        current = np.where(np.isfinite(costs), target, source)
+        backwards = []
+        for _ in range(self.num_nodes):
+            active = current != source
+            if not active.any():
+                break
+            edge = pred[rows, current]
+            backwards.append(np.where(active, edge, -1))
+            current = np.where(active, edge_sources[np.maximum(edge, 0)], source)
+        length = np.sum([edges >= 0 for edges in backwards], axis=0, dtype=np.int64)
+        path_edges = np.full((n_profiles, len(backwards)), -1, dtype=np.int64)
+        for step, edges in enumerate(backwards):
+            has = edges >= 0
+            path_edges[has, length[has] - 1 - step] = edges[has]
+        return path_edges
+
+    def _reconstruct_batch(self, source, target, pred, costs):
+        # Walk predecessor edges back from the target for every profile at once
+        n_profiles = pred.shape[0]
+        rows = np.arange(n_profiles)
+        edge_sources = self._edge_sources()
+        current = np.full(n_profiles, target, dtype=np.int64)
+        steps = [current]
+        for _ in range(self.num_nodes):
+            edge = pred[rows, current]
+            # Finished walks sit at -1 and must not read pred[:, -1] again
+            active = (edge >= 0) & (current != source) & (current >= 0)
+            if not active.any():
+                break
+            current = np.where(active, edge_sources[np.maximum(edge, 0)], -1)
+            steps.append(current)
+        sequences = np.stack(steps[::-1], axis=1)
+
+        # Profiles usually share a handful of distinct paths, so name each once
+        sequences[~np.isfinite(costs)] = -1
+        key = np.zeros(n_profiles, dtype=np.int64)
+        for column in sequences.T:
+            # Re-densify after every column so the combined key cannot overflow
+            _, key = np.unique(key * (self.num_nodes + 1) + column + 1, return_inverse=True)
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        named = [[self.nodes[i] for i in seq if i >= 0] for seq in sequences[first].tolist()]
+        return [list(named[i]) if named[i] else [] for i in inverse.tolist()]
+
+    def _edge_sources(self):
+        if not hasattr(self, '_edge_source_ids'):
+            self._edge_source_ids = np.repeat(np.arange(self.num_nodes), np.diff(self.offsets))
+        return self._edge_source_ids
+
+    def _topological_sort(self):
+        # Kahn's algorithm; None when some nodes never reach indegree zero
+        n = self.num_nodes
+        offsets = self._offsets
+        targets = self._targets
+        indegree = np.bincount(self.targets, minlength=n).tolist()
+        order = [u for u in range(n) if indegree[u] == 0]
+        for u in order:
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    order.append(v)
+        return order if len(order) == n else None
+
+    def _layers(self):
+        # Longest-path layering: every edge points from a lower to a higher layer.
+        # Each layer is (node ids, padded incoming edge ids, padding mask).
+        if hasattr(self, '_layer_cache'):
+            return self._layer_cache
+        if self.topological_order is None:
+            raise ValueError("graph has a cycle; the layered solver needs a DAG")
+        n = self.num_nodes
+        layer_of = [0] * n
+        for u in self.topological_order:
+            for e in range(self._offsets[u], self._offsets[u + 1]):
+                v = self._targets[e]
+                layer_of[v] = max(layer_of[v], layer_of[u] + 1)
+
+        incoming = [[] for _ in range(n)]
+        for e in range(self.num_edges):
+            incoming[self._targets[e]].append(e)
+        by_layer = [[] for _ in range(max(layer_of, default=0) + 1)]
+        for v, layer in enumerate(layer_of):
+            by_layer[layer].append(v)
+        layers = []
+        for nodes in by_layer:
+            width = max(len(incoming[v]) for v in nodes)
+            in_edges = np.zeros((len(nodes), max(width, 1)), dtype=np.int64)
+            mask = np.zeros((len(nodes), max(width, 1)), dtype=bool)
+            for row, v in enumerate(nodes):
+                in_edges[row, :len(incoming[v])] = incoming[v]
+                mask[row, :len(incoming[v])] = True
+            layers.append((np.array(nodes, dtype=np.int64), in_edges, mask))
+        self._layer_cache = (layer_of, layers)
+        return self._layer_cache
+
+    def _out_layers(self):
+        # The _layers() node lists with padded outgoing edge ids, for reverse sweeps
+        if hasattr(self, '_out_layer_cache'):
+            return self._out_layer_cache
+        _, layers = self._layers()
+        out_layers = []
+        for nodes, _, _ in layers:
+            degree = [self._offsets[u + 1] - self._offsets[u] for u in nodes.tolist()]
+            width = max(max(degree), 1)
+            out_edges = np.zeros((len(nodes), width), dtype=np.int64)
+            mask = np.zeros((len(nodes), width), dtype=bool)
+            for row, u in enumerate(nodes.tolist()):
+                out_edges[row, :degree[row]] = np.arange(self._offsets[u], self._offsets[u + 1])
+                mask[row, :degree[row]] = True
+            out_layers.append((nodes, out_edges, mask))
+        self._out_layer_cache = out_layers
+        return out_layers
+
+    def _reconstruct(self, source, target, prev, dist):
+        path = []
+        current = target
+        while current != source:
+            path.append(self.nodes[current])
+            current = prev[current]
+            if current < 0:
+                return [], float('inf')
+        path.append(self.nodes[source])
+        path.reverse()
+        return path, dist[target]
+
+
+# -------------------------
+# Internship topology helpers
+# -------------------------
+def internship_graph():
+    # Frozen stock topology; only the weights change between profiles
+    return build_graph(dict.fromkeys(ACTIVITY_NAMES, 1.0)).freeze()
+
+
+def internship_objective_matrices(graph, objective_tables, activities=ACTIVITY_NAMES):
+    """Stack per-activity objective tables into pareto_batch()'s (K, N, E) input.
+
+    Each table is (N, len(activities)); like build_graph(), the value goes on
+    the edges that lead into the activity and other edges cost 0.
+    """
+    column = {activity: i for i, activity in enumerate(activities)}
+    tables = [np.asarray(table, dtype=np.float64) for table in objective_tables]
+    tables = [table[np.newaxis, :] if table.ndim == 1 else table for table in tables]
+    O = np.zeros((len(tables), tables[0].shape[0], graph.num_edges))
+    for from_node, to_node, _, _ in INTERNSHIP_EDGES:
+        if to_node in column:
+            e = graph.edge_id(from_node, to_node)
+            for k, table in enumerate(tables):
+                O[k, :, e] = table[:, column[to_node]]
+    return O
+
+
+def internship_tolerances(graph, activity_weights, activities=ACTIVITY_NAMES):
+    """Per-activity weight ranges that keep each profile's optimal path.
+
+    Returns (lower, upper), each (N, len(activities)), with -inf and inf when
+    unbounded. Built from sensitivity_batch(): a path through an activity
+    pays its weight on every edge that carries it (1.5x for a learning
+    method), and leaving the path's activity means taking another one of
+    the same stage, so Interview never changes the path.
+    """
+    A = np.asarray(activity_weights, dtype=np.float64)
+    if A.ndim == 1:
+        A = A[np.newaxis, :]
+    W = internship_weight_matrix(graph, A, activities)
+    paths, costs, lower, _ = graph.sensitivity_batch(W, "Student", "Internship_Offer")
+    D = costs[:, np.newaxis]
+    # Cheapest path through each edge: D + slack, or D on the optimal path (every
+    # stock edge is on some path, so only path edges have an unbounded lower end)
+    through = np.where(np.isfinite(lower), D + W - lower, D)
+
+    # via: cheapest path through each activity. multiplicity: how many times
+    # its weight such a path pays, one entry edge plus the edges leaving it
+    column = {activity: i for i, activity in enumerate(activities)}
+    via = np.full(A.shape, np.inf)
+    entry = np.zeros(len(activities))
+    onward = np.zeros(len(activities))
+    for from_node, to_node, activity, scale in INTERNSHIP_EDGES:
+        if to_node in column:
+            i = column[to_node]
+            via[:, i] = np.minimum(via[:, i], through[:, graph.edge_id(from_node, to_node)])
+            if activity == to_node:
+                entry[i] = max(entry[i], scale)
+        elif from_node in column and activity == from_node:
+            onward[column[from_node]] += scale
+    multiplicity = entry + onward
+    on_path = np.array([[activity in path for activity in activities] for path in paths], dtype=bool)
+
+    low = np.where(on_path, -np.inf, A - (via - D) / multiplicity)
+    high = np.full(A.shape, np.inf)
+    for stage in INTERNSHIP_STAGES:
+        members = [column[activity] for activity in stage if activity in column]
+        for i in members:
+            others = [j for j in members if j != i]
+            detour = via[:, others].min(axis=1) if others else np.full(len(paths), np.inf)
+            high[:, i] = np.where(on_path[:, i], A[:, i] + (detour - costs) / multiplicity[i], np.inf)
+    return low, high
+
+
+def internship_weight_matrix(graph, activity_weights, activities=ACTIVITY_NAMES):
+    """Expand (N, len(activities)) activity weights into graph's CSR edge order."""
+    A = np.asarray(activity_weights, dtype=np.float64)
+    if A.ndim == 1:
+        A = A[np.newaxis, :]
+    column = {activity: i for i, activity in enumerate(activities)}
+    W = np.empty((A.shape[0], graph.num_edges))
+    for from_node, to_node, activity, scale in INTERNSHIP_EDGES:
+        e = graph.edge_id(from_node, to_node)
+        W[:, e] = scale if activity is None else A[:, column[activity]] * scale
+    return W
@@ -0,0 +1,144 @@
+import json
+import os
+import struct
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .compiled_graph import CompiledGraph
+
+# File layout: MAGIC, then <version, header length> as little-endian uint32,
+# then a UTF-8 JSON header, then the raw arrays, each starting on an
+# ALIGNMENT-byte boundary so it can be memory-mapped in place.
+MAGIC = b'IPGRAPH\0'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct('<8sII')
+
+
+# -------------------------
+# Image files
+# -------------------------
+def write_image(path, kind, arrays, meta=None):
+    """Write named arrays plus JSON metadata as one aligned binary image."""
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps({'kind': kind, 'arrays': layout, 'meta': meta or {}}).encode()
+    data_start = _aligned(_PREAMBLE.size + len(header))
+
+    # Written next to the target and renamed, so readers never map a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]['offset'])
+                f.write(array.tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_image(path, kind=None):
+    """(meta, arrays) of an image; arrays are read-only memory maps of the file."""
+    with open(path, 'rb') as f:
+        magic, version, header_length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a pathfinder image")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"{path} uses format version {version}; this reader supports up to {FORMAT_VERSION}")
+        header = json.loads(f.read(header_length))
+    if kind is not None and header['kind'] != kind:
+        raise ValueError(f"{path} holds a {header['kind']!r} image, expected {kind!r}")
+
+    data_start = _aligned(_PREAMBLE.size + header_length)
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        shape = tuple(spec['shape'])
+        if 0 in shape:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        else:
+            arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=data_start + spec['offset'], shape=shape)
+    return header['meta'], arrays
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+# -------------------------
+# Frozen graphs
+# -------------------------
+def save_graph(graph, path):
+    """Store a frozen graph (CompiledGraph or InternshipGraph) as node table plus CSR arrays.
+
+    Node names must be JSON values: strings, numbers or tuples of them.
+    """
+    if not isinstance(graph, CompiledGraph):
+        graph = graph.freeze()
+    arrays = {'offsets': graph.offsets, 'targets': graph.targets, 'weights': graph.weights}
+    if graph.is_dag:
+        arrays['topological_order'] = np.asarray(graph.topological_order, dtype=np.int64)
+    meta = {'nodes': [_encode_node(node) for node in graph.nodes]}
+    write_image(path, 'graph', arrays, meta)
+
+
+def load_graph(path):
+    """CompiledGraph whose CSR arrays are mapped from the image, shared between processes."""
+    meta, arrays = read_image(path, 'graph')
+    graph = CompiledGraph([_decode_node(node) for node in meta['nodes']], arrays['offsets'], arrays['targets'],
+                          arrays['weights'], arrays.get('topological_order'))
+    graph.image_path = os.path.abspath(path)
+    return graph
+
+
+def _encode_node(node):
+    return [_encode_node(part) for part in node] if isinstance(node, tuple) else node
+
+
+def _decode_node(node):
+    # JSON has no tuples; lists come back as the tuples they were written from
+    return tuple(_decode_node(part) for part in node) if isinstance(node, list) else node
+
+
+# -------------------------
+# Weight tables
+# -------------------------
+def save_table(table, path):
+    """Store a weights table (DataFrame) or a plain 2-D matrix, e.g. one from internship_weight_matrix()."""
+    if isinstance(table, pd.DataFrame):
+        meta = {
+            'index': [_encode_node(label) for label in table.index.tolist()],
+            'index_names': list(table.index.names),
+            'columns': [_encode_node(label) for label in table.columns.tolist()],
+        }
+        values = table.to_numpy(dtype=np.float64)
+    else:
+        meta = {}
+        values = np.asarray(table, dtype=np.float64)
+    write_image(path, 'table', {'values': values}, meta)
+
+
+def load_table(path, as_frame=True):
+    """The stored table over a read-only memory map; as_frame=False returns the bare array."""
+    meta, arrays = read_image(path, 'table')
+    values = arrays['values']
+    if not as_frame or 'columns' not in meta:
+        return values
+    labels = [_decode_node(label) for label in meta['index']]
+    names = meta['index_names']
+    if len(names) > 1:
+        index = pd.MultiIndex.from_tuples(labels, names=names)
+    else:
+        index = pd.Index(labels, name=names[0])
+    columns = [_decode_node(label) for label in meta['columns']]
+    return pd.DataFrame(values, index=index, columns=columns, copy=False)
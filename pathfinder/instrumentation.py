@@ -0,0 +1,84 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+COUNTERS = {
+    'searches': "Shortest-path searches run",
+    'heap_pushes': "Heap pushes during searches",
+    'heap_pops': "Heap pops during searches",
+    'stale_skips': "Popped heap entries skipped because a shorter distance was already known",
+    'edges_scanned': "Outgoing edges examined from settled nodes",
+    'relaxations': "Edge relaxations that improved a tentative distance",
+    'nodes_settled': "Nodes popped with their final distance",
+}
+
+
+class SearchStats:
+    """Counters and per-phase wall-clock timings for searches and the survey pipeline.
+
+    Attach one to a graph with InternshipGraph.enable_stats(); when no stats
+    object is attached the search runs its uninstrumented loop.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.seconds = {}
+        self.calls = {}
+
+    def add(self, **counts):
+        for name, value in counts.items():
+            self.counters[name] += value
+
+    def record(self, phase, seconds):
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    @contextmanager
+    def timer(self, phase):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started)
+
+    def merge(self, other):
+        for name, value in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        for phase, seconds in other.seconds.items():
+            self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+            self.calls[phase] = self.calls.get(phase, 0) + other.calls[phase]
+
+    def as_dict(self):
+        return {
+            'counters': dict(self.counters),
+            'phases': {phase: {'seconds': self.seconds[phase], 'calls': self.calls[phase]} for phase in self.seconds},
+        }
+
+    # -------------------------
+    # Exporters
+    # -------------------------
+    def to_json_line(self, **labels):
+        import json  # only exporters need it; keeps the core import light
+        record = {'timestamp': time.time(), **labels, **self.as_dict()}
+        return json.dumps(record, sort_keys=True)
+
+    def to_prometheus(self, prefix='pathfinder'):
+        lines = []
+        for name, help_text in COUNTERS.items():
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter", f"{metric} {self.counters[name]}"]
+        if self.seconds:
+            metric = f"{prefix}_phase_seconds_total"
+            lines += [f"# HELP {metric} Wall-clock seconds spent per phase", f"# TYPE {metric} counter"]
+            lines += [f'{metric}{{phase="{phase}"}} {seconds!r}' for phase, seconds in sorted(self.seconds.items())]
+            metric = f"{prefix}_phase_calls_total"
+            lines += [f"# HELP {metric} Timed calls per phase", f"# TYPE {metric} counter"]
+            lines += [f'{metric}{{phase="{phase}"}} {calls}' for phase, calls in sorted(self.calls.items())]
+        return '\n'.join(lines) + '\n'
+
+
+def phase_timer(stats, phase):
+    # Timer when stats are enabled, a no-op context otherwise
+    return nullcontext() if stats is None else stats.timer(phase)
@@ -0,0 +1,801 @@
+import heapq
+import time
+
+from .instrumentation import SearchStats, phase_timer
+
+
+# -------------------------
+# Internship graph topology
+# -------------------------
+LEARNING_METHODS = ['Free_Courses', 'Workshops', 'Hackathons_Events', 'Clubs_Orgs']
+PROFILE_STEPS = ['LinkedIn_Optimized', 'CV_Ready']
+APP_METHODS = ['Career_Fair', 'Alumni_Network', 'Professors', 'Job_Platforms', 'Direct_Apply', 'Company_Contact']
+ACTIVITY_NAMES = LEARNING_METHODS + PROFILE_STEPS + APP_METHODS + ['Interview']
+
+SEARCH_STRATEGIES = ('dijkstra', 'bidirectional', 'astar', 'alt')
+# edge_data attributes minimized together by pareto_paths(); deficit is the value shortfall
+PARETO_OBJECTIVES = ('difficulty', 'deficit', 'hours')
+DEFAULT_LANDMARKS = 4
+
+# (from_node, to_node, activity, scale): the edge weight is weights[activity] * scale,
+# or just scale when activity is None
+INTERNSHIP_EDGES = (
+    # Student → Learning Activities
+    [("Student", m, m, 1.0) for m in LEARNING_METHODS]
+    # Learning Activities → Develop_Skills (reduced weight for progression)
+    + [(m, "Develop_Skills", m, 0.5) for m in LEARNING_METHODS]
+    # Develop_Skills → Profile Building
+    + [("Develop_Skills", p, p, 1.0) for p in PROFILE_STEPS]
+    # Profile Building → Application Methods
+    + [(p, m, m, 1.0) for p in PROFILE_STEPS for m in APP_METHODS]
+    # Application Methods → Interview
+    + [(m, "Interview", "Interview", 1.0) for m in APP_METHODS]
+    # Interview → Internship_Offer (very low weight for final step)
+    + [("Interview", "Internship_Offer", None, 0.1)]
+)
+
+
+# -------------------------
+# Graph builder
+# -------------------------
+class InternshipGraph:
+    def __init__(self):
+        self.edges = {}
+        self.incoming = {}
+        # Extra attributes per edge, e.g. {'hours': 2.0}: {from_node: {to_node: data}}
+        self.edge_data = {}
+        # Last query endpoints and the full shortest-path tree kept for updates
+        self._last_query = None
+        self._tree = None
+        self._compiled = None
+        # A* lower bounds per end node and ALT landmark distances; cleared on every edit
+        self._heuristics = {}
+        # Optional SearchStats; None keeps dijkstra() on its uninstrumented loop
+        self.stats = None
+
+    def enable_stats(self, stats=None):
+        self.stats = stats if stats is not None else SearchStats()
+        return self.stats
+
+    def disable_stats(self):
+        stats, self.stats = self.stats, None
+        return stats
+
+    def add_node(self, node):
+        if node not in self.edges:
+            self.edges[node] = {}
+            self.incoming[node] = {}
+
+    def add_edge(self, from_node, to_node, weight, **data):
+        # Ensure both nodes exist in the graph
+        self.add_node(from_node)
+        self.add_node(to_node)
+        self.edges[from_node][to_node] = weight
+        self.incoming[to_node][from_node] = weight
+        if data:
+            self.edge_data.setdefault(from_node, {})[to_node] = data
+        self._tree = None
+        self._compiled = None
+        self._heuristics.clear()
+
+    def freeze(self):
+        # Compile the current edges into the array-backed engine; reused until the next edit
+        if self._compiled is None:
+            from .compiled_graph import CompiledGraph
+            with phase_timer(self.stats, 'freeze'):
+                self._compiled = CompiledGraph.from_edges(self.edges)
+        return self._compiled
+
+    def shortest_path_tree(self, source):
+        # Full search from source; the tree answers path_to(target) for any target
+        return self.freeze().shortest_path_tree(source)
+
+    def all_pairs(self, method='auto', workers=None):
+        return self.freeze().all_pairs(method, workers)
+
+    def weight_ranges(self, start, end):
+        """{(from_node, to_node): (lower, upper)} keeping the optimal start-end path optimal.
+
+        Each edge's weight may move within its range with the others fixed;
+        -inf and inf mean unbounded. Needs an acyclic graph (see
+        CompiledGraph.sensitivity_batch()).
+        """
+        compiled = self.freeze()
+        _, _, lower, upper = compiled.sensitivity_batch(compiled.weights, start, end)
+        sources = compiled._edge_sources().tolist()
+        return {(compiled.nodes[u], compiled.nodes[v]): (lo, hi)
+                for u, v, lo, hi in zip(sources, compiled.targets.tolist(), lower[0].tolist(), upper[0].tolist())}
+
+    def dijkstra(self, start, end):
+        self._last_query = (start, end)
+        compiled = self._compiled
+        if compiled is not None and compiled.is_dag and start in compiled.index and end in compiled.index:
+            # Frozen and acyclic: linear-time pass in topological order (the heap if an
+            # edge weighs zero), with or without stats
+            return compiled.dijkstra(start, end, self.stats)
+        if self.stats is not None:
+            return self._dijkstra_instrumented(start, end)
+        # Initialize distances
+        distances = {node: float('inf') for node in self.edges}
+        distances[start] = 0
+        previous = {}
+        pq = [(0, start)]
+
+        while pq:
+            current_dist, current_node = heapq.heappop(pq)
+
+            if current_node == end:
+                break
+
+            if current_dist > distances[current_node]:
+                continue
+
+            if current_node in self.edges:
+                for neighbor, weight in self.edges[current_node].items():
+                    distance = current_dist + weight
+                    if distance < distances[neighbor]:
+                        distances[neighbor] = distance
+                        previous[neighbor] = current_node
+                        heapq.heappush(pq, (distance, neighbor))
+
+        # Reconstruct path
+        path = []
+        current = end
+        while current != start:
+            path.append(current)
+            current = previous.get(current)
+            if current is None:
+                return [], float('inf')
+        path.append(start)
+        path.reverse()
+        return path, distances[end]
+
+    def _dijkstra_instrumented(self, start, end):
+        # Same search as dijkstra(), counting heap traffic and timing each phase
+        self._last_query = (start, end)
+        pushes = pops = stale = scanned = relaxed = settled = 0
+        started = time.perf_counter()
+        distances = {node: float('inf') for node in self.edges}
+        distances[start] = 0
+        previous = {}
+        pq = [(0, start)]
+        pushes += 1
+
+        while pq:
+            current_dist, current_node = heapq.heappop(pq)
+            pops += 1
+
+            if current_node == end:
+                settled += 1
+                break
+
+            if current_dist > distances[current_node]:
+                stale += 1
+                continue
+            settled += 1
+
+            if current_node in self.edges:
+                for neighbor, weight in self.edges[current_node].items():
+                    scanned += 1
+                    distance = current_dist + weight
+                    if distance < distances[neighbor]:
+                        distances[neighbor] = distance
+                        previous[neighbor] = current_node
+                        heapq.heappush(pq, (distance, neighbor))
+                        relaxed += 1
+                        pushes += 1
+        searched = time.perf_counter()
+
+        path = []
+        current = end
+        while current != start:
+            path.append(current)
+            current = previous.get(current)
+            if current is None:
+                path = None
+                break
+        if path is not None:
+            path.append(start)
+            path.reverse()
+        finished = time.perf_counter()
+
+        stats = self.stats
+        stats.add(searches=1, heap_pushes=pushes, heap_pops=pops, stale_skips=stale,
+                  edges_scanned=scanned, relaxations=relaxed, nodes_settled=settled)
+        stats.record('search', searched - started)
+        stats.record('reconstruct', finished - searched)
+        if path is None:
+            return [], float('inf')
+        return path, distances[end]
+
+    # -------------------------
+    # Incremental updates
+    # -------------------------
+    def update_edge_weight(self, from_node, to_node, weight, start=None, end=None):
+        """Change (or insert) one edge and repair the shortest-path tree in place.
+
+        start/end default to the endpoints of the last dijkstra() query.
+        Returns the new (path, cost) from start to end.
+        """
+        if start is None or end is None:
+            if self._last_query is None:
+                raise ValueError("no previous query; pass start and end explicitly")
+            start, end = self._last_query
+        self._last_query = (start, end)
+
+        if self._tree is None or self._tree['source'] != start:
+            self.add_edge(from_node, to_node, weight)
+            self._tree = self._shortest_path_tree(start)
+            return self._tree_path(end)
+
+        old_weight = self.edges.get(from_node, {}).get(to_node)
+        self.add_node(from_node)
+        self.add_node(to_node)
+        self.edges[from_node][to_node] = weight
+        self.incoming[to_node][from_node] = weight
+        self._compiled = None
+        self._heuristics.clear()
+
+        tree = self._tree
+        dist = tree['dist']
+        pq = []
+        if old_weight is None or weight < old_weight:
+            # Decrease / insertion: only nodes reachable through the cheaper edge can improve
+            candidate = dist.get(from_node, float('inf')) + weight
+            if candidate < dist.get(to_node, float('inf')):
+                dist[to_node] = candidate
+                self._reparent(to_node, from_node)
+                pq.append((candidate, to_node))
+        elif weight > old_weight and tree['previous'].get(to_node) == from_node:
+            # Increase on a tree edge: only the subtree hanging below it is affected
+            affected = self._subtree(to_node)
+            for node in affected:
+                dist[node] = float('inf')
+            for node in affected:
+                for parent, w in self.incoming[node].items():
+                    if parent not in affected and dist.get(parent, float('inf')) + w < dist[node]:
+                        dist[node] = dist[parent] + w
+                        self._reparent(node, parent)
+                if dist[node] < float('inf'):
+                    heapq.heappush(pq, (dist[node], node))
+                else:
+                    self._reparent(node, None)
+        self._propagate(pq)
+        return self._tree_path(end)
+
+    def _shortest_path_tree(self, start):
+        # Full search without early exit, keeping children lists for subtree walks
+        dist = {node: float('inf') for node in self.edges}
+        dist[start] = 0
+        self._tree = {'source': start, 'dist': dist, 'previous': {}, 'children': {}}
+        self._propagate([(0, start)])
+        return self._tree
+
+    def _propagate(self, pq):
+        dist = self._tree['dist']
+        while pq:
+            current_dist, current_node = heapq.heappop(pq)
+            if current_dist > dist[current_node]:
+                continue
+            for neighbor, weight in self.edges.get(current_node, {}).items():
+                distance = current_dist + weight
+                if distance < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = distance
+                    self._reparent(neighbor, current_node)
+                    heapq.heappush(pq, (distance, neighbor))
+
+    def _reparent(self, node, parent):
+        previous = self._tree['previous']
+        children = self._tree['children']
+        old_parent = previous.pop(node, None)
+        if old_parent is not None:
+            children[old_parent].discard(node)
+        if parent is not None:
+            previous[node] = parent
+            children.setdefault(parent, set()).add(node)
+
+    def _subtree(self, root):
+        # Set of root and every tree descendant; callers test membership per in-edge
+        children = self._tree['children']
+        nodes = [root]
+        seen = {root}
+        for node in nodes:
+            for child in children.get(node, ()):
+                if child not in seen:
+                    seen.add(child)
+                    nodes.append(child)
+        return seen
+
+    def _tree_path(self, end):
+        start = self._tree['source']
+        previous = self._tree['previous']
+        path = []
+        current = end
+        while current != start:
+            path.append(current)
+            current = previous.get(current)
+            if current is None:
+                return [], float('inf')
+        path.append(start)
+        path.reverse()
+        return path, self._tree['dist'][end]
+
+
+    # -------------------------
+    # K shortest paths
+    # -------------------------
+    def k_shortest_paths(self, start, end, k):
+        """Up to k loopless (path, cost) pairs from start to end, cheapest first (Yen's algorithm)."""
+        if k <= 0 or start not in self.edges or end not in self.edges:
+            return []
+        # Distances to `end` in the unrestricted graph: an A* heuristic for every
+        # spur search and a lower bound for pruning whole spurs
+        to_end = self._distances_to(end)
+        first = self._spur_search(start, end, to_end, set(), set())
+        if first is None:
+            return []
+
+        accepted = [(first[1], first[0], 0)]
+        candidates = []
+        seen = {tuple(first[0])}
+        while len(accepted) < k:
+            _, path, deviation = accepted[-1]
+            prefix = [0.0]
+            for u, v in zip(path, path[1:]):
+                prefix.append(prefix[-1] + self.edges[u][v])
+
+            # Lawler's refinement: spurs before the deviation index were
+            # already explored when this path's parent was accepted
+            for i in range(deviation, len(path) - 1):
+                spur_node = path[i]
+                root = path[:i + 1]
+                need = k - len(accepted)
+                if len(candidates) >= need:
+                    threshold = heapq.nsmallest(need, candidates)[-1][0]
+                    if prefix[i] + to_end.get(spur_node, float('inf')) >= threshold:
+                        continue
+                removed_edges = {(p[i], p[i + 1]) for _, p, _ in accepted if len(p) > i + 1 and p[:i + 1] == root}
+                removed_nodes = set(root[:-1])
+                spur = self._spur_search(spur_node, end, to_end, removed_nodes, removed_edges)
+                if spur is None:
+                    continue
+                candidate = root[:-1] + spur[0]
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (prefix[i] + spur[1], candidate, i))
+
+            if not candidates:
+                break
+            accepted.append(heapq.heappop(candidates))
+        return [(path, cost) for cost, path, _ in accepted]
+
+    def _distances_to(self, end, resource=None):
+        # Dijkstra over incoming edges, on the weights or on an edge_data attribute
+        dist = {end: 0}
+        pq = [(0, end)]
+        while pq:
+            current_dist, current_node = heapq.heappop(pq)
+            if current_dist > dist[current_node]:
+                continue
+            for neighbor, weight in self.incoming.get(current_node, {}).items():
+                if resource is not None:
+                    weight = self.edge_data.get(neighbor, {}).get(current_node, {}).get(resource, 0)
+                distance = current_dist + weight
+                if distance < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = distance
+                    heapq.heappush(pq, (distance, neighbor))
+        return dist
+
+    def _spur_search(self, start, end, to_end, removed_nodes, removed_edges):
+        # A* avoiding removed nodes/edges; to_end stays consistent because removals only lengthen paths
+        inf = float('inf')
+        if to_end.get(start, inf) == inf:
+            return None
+        dist = {start: 0}
+        previous = {}
+        pq = [(to_end[start], 0, start)]
+        while pq:
+            _, current_dist, current_node = heapq.heappop(pq)
+            if current_node == end:
+                path = [end]
+                while path[-1] != start:
+                    path.append(previous[path[-1]])
+                path.reverse()
+                return path, current_dist
+            if current_dist > dist[current_node]:
+                continue
+            for neighbor, weight in self.edges[current_node].items():
+                if neighbor in removed_nodes or (current_node, neighbor) in removed_edges:
+                    continue
+                h = to_end.get(neighbor, inf)
+                if h == inf:
+                    continue
+                distance = current_dist + weight
+                if distance < dist.get(neighbor, inf):
+                    dist[neighbor] = distance
+                    previous[neighbor] = current_node
+                    heapq.heappush(pq, (distance + h, distance, neighbor))
+        return None
+
+    # -------------------------
+    # Search strategies
+    # -------------------------
+    def find_path(self, start, end, strategy='dijkstra'):
+        """(path, cost) from start to end using one of SEARCH_STRATEGIES.
+
+        'bidirectional' meets a forward and a backward search in the middle;
+        'astar' is guided by per-layer minimum edge weights towards end and
+        'alt' by landmark distances (see prepare_landmarks()). All return the
+        same cost as dijkstra(); with equal-cost ties the path may differ.
+        Settled-node counts land in self.stats when stats are enabled.
+        """
+        if strategy == 'dijkstra':
+            return self.dijkstra(start, end)
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}; expected one of {SEARCH_STRATEGIES}")
+        self._last_query = (start, end)
+        if start == end:
+            return [start], 0
+        if strategy == 'bidirectional':
+            return self._bidirectional(start, end)
+        if strategy == 'astar':
+            bound = self._layer_bounds(end)
+            return self._astar(start, end, lambda node: bound.get(node, float('inf')))
+        return self._astar(start, end, self._landmark_bound(end))
+
+    def _record_search(self, started, **counts):
+        if self.stats is not None:
+            self.stats.add(searches=1, **counts)
+            self.stats.record('search', time.perf_counter() - started)
+
+    def _bidirectional(self, start, end):
+        # Forward search over edges, backward over incoming; stop once the two
+        # queue minima together can no longer beat the best meeting point
+        inf = float('inf')
+        started = time.perf_counter()
+        pushes = pops = stale = scanned = relaxed = settled = 0
+        adjacency = (self.edges, self.incoming)
+        dist = ({start: 0}, {end: 0})
+        previous = ({}, {})
+        queues = ([(0, start)], [(0, end)])
+        pushes += 2
+        best, meet = inf, None
+
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            current_dist, current_node = heapq.heappop(queues[side])
+            pops += 1
+            if current_dist > dist[side][current_node]:
+                stale += 1
+                continue
+            settled += 1
+            here, there = dist[side], dist[1 - side]
+            for neighbor, weight in adjacency[side].get(current_node, {}).items():
+                scanned += 1
+                distance = current_dist + weight
+                if distance < here.get(neighbor, inf):
+                    here[neighbor] = distance
+                    previous[side][neighbor] = current_node
+                    heapq.heappush(queues[side], (distance, neighbor))
+                    relaxed += 1
+                    pushes += 1
+                    if neighbor in there and distance + there[neighbor] < best:
+                        best, meet = distance + there[neighbor], neighbor
+
+        self._record_search(started, heap_pushes=pushes, heap_pops=pops, stale_skips=stale,
+                            edges_scanned=scanned, relaxations=relaxed, nodes_settled=settled)
+        if meet is None:
+            return [], inf
+        # Backward predecessors point towards end
+        path = _trace(previous[0], start, meet)[::-1] + _trace(previous[1], end, meet)[1:]
+        # Re-add from start so the float sum matches a forward search exactly
+        cost = 0
+        for u, v in zip(path, path[1:]):
+            cost += self.edges[u][v]
+        return path, cost
+
+    def _astar(self, start, end, heuristic):
+        # heuristic(node) must be a consistent lower bound on the cost to end;
+        # inf marks nodes that cannot reach end and are never queued
+        inf = float('inf')
+        started = time.perf_counter()
+        pushes = pops = stale = scanned = relaxed = settled = 0
+        dist = {start: 0}
+        previous = {}
+        pq = [(heuristic(start), 0, start)] if heuristic(start) < inf else []
+        pushes += len(pq)
+        found = False
+
+        while pq:
+            _, current_dist, current_node = heapq.heappop(pq)
+            pops += 1
+            if current_node == end:
+                settled += 1
+                found = True
+                break
+            if current_dist > dist[current_node]:
+                stale += 1
+                continue
+            settled += 1
+            for neighbor, weight in self.edges.get(current_node, {}).items():
+                scanned += 1
+                distance = current_dist + weight
+                if distance < dist.get(neighbor, inf):
+                    h = heuristic(neighbor)
+                    if h == inf:
+                        continue
+                    dist[neighbor] = distance
+                    previous[neighbor] = current_node
+                    heapq.heappush(pq, (distance + h, distance, neighbor))
+                    relaxed += 1
+                    pushes += 1
+
+        self._record_search(started, heap_pushes=pushes, heap_pops=pops, stale_skips=stale,
+                            edges_scanned=scanned, relaxations=relaxed, nodes_settled=settled)
+        if not found:
+            return [], inf
+        return _trace(previous, start, end)[::-1], dist[end]
+
+    def _layer_bounds(self, end):
+        """Lower bound on the cost to end from every node that can reach it.
+
+        hops(v) is the fewest edges from v to end. Any path from v crosses one
+        edge from hop level j to j - 1 for every j <= hops(v), so summing the
+        cheapest such edge per level never overestimates.
+        """
+        key = ('layer', end)
+        if key not in self._heuristics:
+            hops = {end: 0}
+            frontier = [end]
+            while frontier:
+                following = []
+                for node in frontier:
+                    for parent in self.incoming.get(node, {}):
+                        if parent not in hops:
+                            hops[parent] = hops[node] + 1
+                            following.append(parent)
+                frontier = following
+
+            cheapest = {}
+            for node, level in hops.items():
+                for parent, weight in self.incoming.get(node, {}).items():
+                    if hops[parent] == level + 1 and weight < cheapest.get(level + 1, float('inf')):
+                        cheapest[level + 1] = weight
+            totals = [0.0]
+            for level in range(1, len(cheapest) + 1):
+                totals.append(totals[-1] + cheapest[level])
+            self._heuristics[key] = {node: totals[level] for node, level in hops.items()}
+        return self._heuristics[key]
+
+    def prepare_landmarks(self, count=DEFAULT_LANDMARKS):
+        """Choose ALT landmarks by farthest-point selection on hop distance.
+
+        Stores exact distances from and to each landmark; reused by every
+        'alt' query until the graph is edited.
+        """
+        inf = float('inf')
+        landmarks = []
+        nearest = {node: inf for node in self.edges}
+        candidate = next(iter(self.edges), None)
+        if candidate is not None:
+            # Seed with the node farthest from an arbitrary one
+            candidate = max(self._undirected_hops(candidate).items(), key=lambda item: item[1])[0]
+        while candidate is not None and len(landmarks) < count:
+            landmarks.append((self._distances_from(candidate), self._distances_to(candidate)))
+            for node, hops in self._undirected_hops(candidate).items():
+                nearest[node] = min(nearest[node], hops)
+            candidate, farthest = max(nearest.items(), key=lambda item: item[1])
+            if farthest == 0:
+                break
+        self._heuristics['landmarks'] = landmarks
+        return landmarks
+
+    def _landmark_bound(self, end):
+        # Triangle inequality: d(v, end) >= d(L, end) - d(L, v) and >= d(v, L) - d(end, L)
+        inf = float('inf')
+        landmarks = self._heuristics.get('landmarks') or self.prepare_landmarks()
+        terms = [(from_l, to_l, from_l.get(end, inf), to_l.get(end, inf)) for from_l, to_l in landmarks]
+        memo = {}
+
+        def heuristic(node):
+            bound = memo.get(node)
+            if bound is None:
+                bound = 0.0
+                for from_l, to_l, l_end, end_l in terms:
+                    l_node = from_l.get(node, inf)
+                    if l_node < inf:
+                        bound = max(bound, l_end - l_node)
+                    if end_l < inf:
+                        bound = max(bound, to_l.get(node, inf) - end_l)
+                memo[node] = bound
+            return bound
+        return heuristic
+
+    def _distances_from(self, start):
+        dist = {start: 0}
+        pq = [(0, start)]
+        while pq:
+            current_dist, current_node = heapq.heappop(pq)
+            if current_dist > dist[current_node]:
+                continue
+            for neighbor, weight in self.edges.get(current_node, {}).items():
+                distance = current_dist + weight
+                if distance < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = distance
+                    heapq.heappush(pq, (distance, neighbor))
+        return dist
+
+    def _undirected_hops(self, source):
+        hops = {source: 0}
+        frontier = [source]
+        while frontier:
+            following = []
+            for node in frontier:
+                for neighbor in (*self.edges.get(node, {}), *self.incoming.get(node, {})):
+                    if neighbor not in hops:
+                        hops[neighbor] = hops[node] + 1
+                        following.append(neighbor)
+            frontier = following
+        return hops
+
+
+    # -------------------------
+    # Resource-constrained paths
+    # -------------------------
+    def path_attribute(self, path, name):
+        # Summed edge_data attribute along path; edges without it count 0
+        return sum(self.edge_data.get(u, {}).get(v, {}).get(name, 0) for u, v in zip(path, path[1:]))
+
+    def constrained_path(self, start, end, budget, resource='hours'):
+        """Cheapest path from start to end whose summed `resource` stays within budget.
+
+        Returns (path, cost, used); ([], inf, inf) when nothing fits. Edges
+        without the attribute in edge_data use none of it.
+        """
+        inf = float('inf')
+        self._last_query = (start, end)
+        if start == end:
+            return [start], 0, 0
+        # Exact costs to end order the labels (A*); the least resource to end prunes them
+        to_end = self._distances_to(end)
+        least = self._distances_to(end, resource)
+        if least.get(start, inf) > budget:
+            return [], inf, inf
+
+        started = time.perf_counter()
+        pushes = pops = settled = 0
+        labels = [(start, -1)]
+        # Labels at a node are expanded in cost order, so a later one is
+        # dominated unless it uses strictly less of the resource
+        least_used = {}
+        pq = [(to_end[start], 0, 0, 0)]
+        pushes += 1
+        result = [], inf, inf
+
+        while pq:
+            _, cost, used, label = heapq.heappop(pq)
+            pops += 1
+            node = labels[label][0]
+            if used >= least_used.get(node, inf):
+                continue
+            least_used[node] = used
+            settled += 1
+            if node == end:
+                result = _label_path(labels, label), cost, used
+                break
+            edge_data = self.edge_data.get(node, {})
+            for neighbor, weight in self.edges[node].items():
+                if neighbor not in to_end:
+                    continue
+                spent = used + edge_data.get(neighbor, {}).get(resource, 0)
+                if spent + least[neighbor] > budget or spent >= least_used.get(neighbor, inf):
+                    continue
+                labels.append((neighbor, label))
+                heapq.heappush(pq, (cost + weight + to_end[neighbor], cost + weight, spent, len(labels) - 1))
+                pushes += 1
+
+        self._record_search(started, heap_pushes=pushes, heap_pops=pops, stale_skips=pops - settled,
+                            nodes_settled=settled)
+        return result
+
+    # -------------------------
+    # Pareto-optimal paths
+    # -------------------------
+    def pareto_paths(self, start, end, objectives=PARETO_OBJECTIVES):
+        """Every Pareto-optimal path from start to end over several edge_data attributes.
+
+        Returns [(path, costs)] sorted lexicographically by costs, a tuple in
+        objectives order; each non-dominated cost vector appears once. Edges
+        without an attribute add 0 to that objective.
+        """
+        if start == end:
+            return [([start], (0,) * len(objectives))]
+        # Least cost to end per objective: a label whose optimistic completion
+        # is already matched by a path at end is dropped
+        bounds = [self._distances_to(end, name) for name in objectives]
+        if start not in bounds[0]:
+            return []
+
+        started = time.perf_counter()
+        pushes = pops = settled = 0
+        labels = [(start, -1)]
+        # Labels pop in lexicographic order, so nothing popped later can
+        # dominate a label already kept at a node
+        fronts = {}
+        pq = [((0,) * len(objectives), 0)]
+        pushes += 1
+        results = []
+
+        while pq:
+            costs, label = heapq.heappop(pq)
+            pops += 1
+            node = labels[label][0]
+            front = fronts.setdefault(node, [])
+            if _dominated(costs, front):
+                continue
+            front.append(costs)
+            settled += 1
+            if node == end:
+                results.append((_label_path(labels, label), costs))
+                continue
+            edge_data = self.edge_data.get(node, {})
+            end_front = fronts.get(end, ())
+            for neighbor in self.edges[node]:
+                if neighbor not in bounds[0]:
+                    continue
+                data = edge_data.get(neighbor, {})
+                extended = tuple(c + data.get(name, 0) for c, name in zip(costs, objectives))
+                if _dominated(extended, fronts.get(neighbor, ())):
+                    continue
+                if end_front and _dominated(tuple(c + b[neighbor] for c, b in zip(extended, bounds)), end_front):
+                    continue
+                labels.append((neighbor, label))
+                heapq.heappush(pq, (extended, len(labels) - 1))
+                pushes += 1
+
+        self._record_search(started, heap_pushes=pushes, heap_pops=pops, stale_skips=pops - settled,
+                            nodes_settled=settled)
+        return results
+
+
+def _dominated(costs, front):
+    # Weak dominance: some kept vector is no worse in every objective
+    return any(all(f <= c for f, c in zip(kept, costs)) for kept in front)
+
+
+def _label_path(labels, label):
+    path = []
+    while label >= 0:
+        node, label = labels[label]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def _trace(previous, start, end):
+    # Nodes from end back to start along a predecessor map
+    path = [end]
+    while path[-1] != start:
+        path.append(previous[path[-1]])
+    return path
+
+
+def build_graph(weights, stats=None, hours=None, attributes=None):
+    # stats, when given, times the build and stays attached to the graph.
+    # hours maps activities to time estimates and attributes maps activities to
+    # {name: value} (e.g. the Pareto objectives); both are stored in edge_data
+    # on the edges that lead into the activity
+    with phase_timer(stats, 'build'):
+        graph = InternshipGraph()
+        for from_node, to_node, activity, scale in INTERNSHIP_EDGES:
+            weight = scale if activity is None else weights[activity] * scale
+            data = {}
+            if hours is not None:
+                data['hours'] = hours.get(to_node, 0.0)
+            if attributes is not None:
+                data.update(attributes.get(to_node, {}))
+            graph.add_edge(from_node, to_node, weight, **data)
+    graph.stats = stats
+    return graph
@@ -0,0 +1,152 @@
+import os
+
+from .instrumentation import phase_timer
+from .internship_graph import ACTIVITY_NAMES, APP_METHODS, LEARNING_METHODS
+from .sample_profiles import PERSONALITIES
+from .survey_columns import ACTIVITIES, PERSONALITY_COLUMN
+from .weight_cache import WeightCache
+
+# -------------------------
+# 1. Load CSV
+# -------------------------
+# One or more Fillout exports; they are streamed in chunks in step 4
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "Fillout New form ezuaT results (2).csv")
+
+# -------------------------
+# 2. Map activities to columns
+# -------------------------
+activities = ACTIVITIES
+
+# -------------------------
+# 3. Personality types
+# -------------------------
+personalities = PERSONALITIES
+
+
+# -------------------------
+# 4. Compute simplified weights (difficulty / value)
+# -------------------------
+def load_personality_weights(file_paths, cache, stats=None):
+    # Derived weights and solved paths are cached on disk, keyed by the CSV
+    # contents and the activity mapping
+    cache_key = cache.key(file_paths, activities, by=PERSONALITY_COLUMN, personalities=personalities)
+    cached = cache.get(cache_key) or {}
+
+    if 'personality_weights' not in cached:
+        # pandas is only needed to read the exports; a warm cache skips it
+        from .survey_loader import accumulate_weights
+        survey = accumulate_weights(file_paths, by=PERSONALITY_COLUMN, activities=activities, stats=stats)
+        weights_table = survey.weights()
+        weights_table = weights_table.reindex(personalities).dropna(how='all')
+        cached['rows'] = survey.rows
+        cached['personality_weights'] = weights_table.to_dict('index')
+    return cache_key, cached
+
+
+# -------------------------
+# 5. DIJKSTRA ALGORITHM IMPLEMENTATION
+# -------------------------
+# InternshipGraph lives in internship_graph.py (shared with Demo.py);
+# compiled_graph.py solves all profiles in one batched pass
+
+# -------------------------
+# 6. BUILD GRAPH AND FIND OPTIMAL PATHS
+# -------------------------
+def solve_personalities(cache, cache_key, cached, stats=None):
+    if 'paths' not in cached:
+        from .compiled_graph import internship_graph, internship_weight_matrix
+        personality_weights = cached['personality_weights']
+        # One frozen topology; each personality only contributes a row of weights
+        graph = internship_graph()
+        activity_matrix = [[personality_weights[p][act] for act in ACTIVITY_NAMES] for p in personality_weights]
+        with phase_timer(stats, 'search'):
+            paths, costs = graph.solve_batch(internship_weight_matrix(graph, activity_matrix),
+                                             "Student", "Internship_Offer")
+        # Plain lists, so reading the entry back needs no numpy
+        cached['paths'], cached['costs'] = paths, costs.tolist()
+        cache.put(cache_key, cached)
+    return cached['paths'], cached['costs']
+
+
+def print_paths(personality_weights, all_paths, all_costs):
+    print("\n" + "="*80)
+    print("DIJKSTRA OPTIMAL PATHS FOR INTERNSHIP PREPARATION")
+    print("="*80)
+
+    for personality, path, total_cost in zip(personality_weights.keys(), all_paths, all_costs):
+        weights = personality_weights[personality]
+
+        print(f" {personality.upper()} STUDENTS:")
+        print(f"Optimal Path: {' → '.join(path)}")
+        print(f"Total Cost: {total_cost:.3f}")
+
+        # Show key decisions with weights
+        if len(path) > 2:
+            learning_choice = path[1]
+            application_choice = path[5] if len(path) > 5 else path[-2]
+
+            print(f"Key Decisions:")
+            print(f"  Learning Method: {learning_choice} (weight: {weights.get(learning_choice, 'N/A'):.3f})")
+            print(f"  Application Method: {application_choice} (weight: {weights.get(application_choice, 'N/A'):.3f})")
+
+
+# -------------------------
+# 7. SHOW ALL WEIGHTS FOR REFERENCE
+# -------------------------
+def print_weights(personality_weights):
+    print("\n" + "="*80)
+    print("DETAILED WEIGHTS ANALYSIS (Difficulty / Value)")
+    print("="*80)
+
+    for personality, weights in personality_weights.items():
+        print(f"\n{personality.upper()} PERSONALITY:")
+
+        print("Learning Methods:")
+        for method in LEARNING_METHODS:
+            print(f"  {method:18} → {weights[method]:.3f}")
+
+        print("\nApplication Methods:")
+        for method in APP_METHODS:
+            print(f"  {method:18} → {weights[method]:.3f}")
+
+        print(f"\nProfile Building:")
+        print(f"  LinkedIn_Optimized   → {weights['LinkedIn_Optimized']:.3f}")
+        print(f"  CV_Ready            → {weights['CV_Ready']:.3f}")
+        print(f"  Interview Prep      → {weights['Interview']:.3f}")
+
+
+# -------------------------
+# 8. QUICK SUMMARY
+# -------------------------
+def print_summary(personality_weights):
+    print("\n" + "="*80)
+    print("QUICK RECOMMENDATIONS")
+    print("="*80)
+
+    for personality in personality_weights.keys():
+        weights = personality_weights[personality]
+
+        # Find best learning method (lowest weight)
+        best_learn = min(LEARNING_METHODS, key=lambda x: weights[x])
+
+        # Find best application method (lowest weight)
+        best_app = min(APP_METHODS, key=lambda x: weights[x])
+
+        print(f"\n{personality.upper()} Students:")
+        print(f"  START WITH: {best_learn}")
+        print(f"  APPLY VIA:  {best_app}")
+        print(f"  STRATEGY:   Focus on what feels easiest and most valuable for you")
+
+
+def report(file_paths, stats=None):
+    cache = WeightCache()
+    cache_key, cached = load_personality_weights(file_paths, cache, stats)
+    personality_weights = cached['personality_weights']
+    print(f"Analyzed {cached['rows']} survey responses")
+
+    all_paths, all_costs = solve_personalities(cache, cache_key, cached, stats)
+    print_paths(personality_weights, all_paths, all_costs)
+    print_weights(personality_weights)
+    print_summary(personality_weights)
+
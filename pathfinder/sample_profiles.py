@@ -0,0 +1,96 @@
+PERSONALITIES = ["Shy", "Neutral", "Social"]
+
+
+# Sample weights (replace with your actual data loading)
+def get_sample_weights(personality):
+    if personality == "Shy":
+        return {
+            'Free_Courses': 0.8, 'Workshops': 1.2, 'Hackathons_Events': 1.5, 'Clubs_Orgs': 1.4,
+            'LinkedIn_Optimized': 0.9, 'CV_Ready': 0.7, 'Career_Fair': 1.3,
+            'Alumni_Network': 1.6, 'Professors': 1.4, 'Job_Platforms': 0.9,
+            'Direct_Apply': 1.1, 'Company_Contact': 1.5, 'Interview': 1.0
+        }
+    elif personality == "Neutral":
+        return {
+            'Free_Courses': 1.0, 'Workshops': 1.0, 'Hackathons_Events': 1.2, 'Clubs_Orgs': 1.1,
+            'LinkedIn_Optimized': 0.8, 'CV_Ready': 0.8, 'Career_Fair': 1.0,
+            'Alumni_Network': 1.2, 'Professors': 1.1, 'Job_Platforms': 0.9,
+            'Direct_Apply': 1.0, 'Company_Contact': 1.2, 'Interview': 0.9
+        }
+    else:  # Social
+        return {
+            'Free_Courses': 1.2, 'Workshops': 0.9, 'Hackathons_Events': 0.8, 'Clubs_Orgs': 0.7,
+            'LinkedIn_Optimized': 0.7, 'CV_Ready': 0.8, 'Career_Fair': 0.9,
+            'Alumni_Network': 0.8, 'Professors': 0.9, 'Job_Platforms': 1.0,
+            'Direct_Apply': 1.1, 'Company_Contact': 0.8, 'Interview': 0.8
+        }
+
+
+# Sample time estimates in hours (per-personality means of the bundled survey's "How long ..." answers)
+def get_sample_hours(personality):
+    if personality == "Shy":
+        return {
+            'Free_Courses': 10.0, 'Workshops': 7.0, 'Hackathons_Events': 9.7, 'Clubs_Orgs': 10.8,
+            'LinkedIn_Optimized': 2.8, 'CV_Ready': 2.2, 'Career_Fair': 7.3,
+            'Alumni_Network': 4.2, 'Professors': 2.2, 'Job_Platforms': 6.4,
+            'Direct_Apply': 3.9, 'Company_Contact': 3.6, 'Interview': 9.0
+        }
+    elif personality == "Neutral":
+        return {
+            'Free_Courses': 12.2, 'Workshops': 6.9, 'Hackathons_Events': 13.6, 'Clubs_Orgs': 10.2,
+            'LinkedIn_Optimized': 4.0, 'CV_Ready': 2.7, 'Career_Fair': 7.0,
+            'Alumni_Network': 5.1, 'Professors': 4.3, 'Job_Platforms': 5.7,
+            'Direct_Apply': 4.1, 'Company_Contact': 6.5, 'Interview': 7.1
+        }
+    else:  # Social
+        return {
+            'Free_Courses': 14.1, 'Workshops': 7.1, 'Hackathons_Events': 13.4, 'Clubs_Orgs': 8.5,
+            'LinkedIn_Optimized': 4.5, 'CV_Ready': 4.6, 'Career_Fair': 7.6,
+            'Alumni_Network': 4.1, 'Professors': 6.0, 'Job_Platforms': 7.4,
+            'Direct_Apply': 4.4, 'Company_Contact': 6.8, 'Interview': 7.4
+        }
+
+
+# Sample difficulty (1-5) and value deficit (MAX_VALUE - value) per activity, from the same survey
+def get_sample_objectives(personality):
+    hours = get_sample_hours(personality)
+    if personality == "Shy":
+        difficulty = {
+            'Free_Courses': 2.7, 'Workshops': 3.2, 'Hackathons_Events': 3.3, 'Clubs_Orgs': 3.3,
+            'LinkedIn_Optimized': 3.2, 'CV_Ready': 2.8, 'Career_Fair': 3.3,
+            'Alumni_Network': 3.3, 'Professors': 3.0, 'Job_Platforms': 2.3,
+            'Direct_Apply': 2.5, 'Company_Contact': 3.5, 'Interview': 3.3
+        }
+        deficit = {
+            'Free_Courses': 1.5, 'Workshops': 3.0, 'Hackathons_Events': 3.8, 'Clubs_Orgs': 4.0,
+            'LinkedIn_Optimized': 1.5, 'CV_Ready': 1.0, 'Career_Fair': 3.2,
+            'Alumni_Network': 3.2, 'Professors': 3.5, 'Job_Platforms': 2.7,
+            'Direct_Apply': 2.8, 'Company_Contact': 3.5, 'Interview': 1.0
+        }
+    elif personality == "Neutral":
+        difficulty = {
+            'Free_Courses': 3.1, 'Workshops': 3.0, 'Hackathons_Events': 3.2, 'Clubs_Orgs': 2.7,
+            'LinkedIn_Optimized': 2.6, 'CV_Ready': 2.3, 'Career_Fair': 2.6,
+            'Alumni_Network': 2.5, 'Professors': 2.8, 'Job_Platforms': 3.1,
+            'Direct_Apply': 2.8, 'Company_Contact': 3.4, 'Interview': 3.5
+        }
+        deficit = {
+            'Free_Courses': 1.4, 'Workshops': 3.6, 'Hackathons_Events': 4.3, 'Clubs_Orgs': 3.8,
+            'LinkedIn_Optimized': 1.4, 'CV_Ready': 0.6, 'Career_Fair': 3.5,
+            'Alumni_Network': 2.6, 'Professors': 2.3, 'Job_Platforms': 2.5,
+            'Direct_Apply': 2.6, 'Company_Contact': 2.3, 'Interview': 1.0
+        }
+    else:  # Social
+        difficulty = {
+            'Free_Courses': 3.1, 'Workshops': 2.9, 'Hackathons_Events': 3.0, 'Clubs_Orgs': 2.1,
+            'LinkedIn_Optimized': 3.2, 'CV_Ready': 2.9, 'Career_Fair': 3.7,
+            'Alumni_Network': 2.8, 'Professors': 3.2, 'Job_Platforms': 2.9,
+            'Direct_Apply': 2.7, 'Company_Contact': 3.3, 'Interview': 3.5
+        }
+        deficit = {
+            'Free_Courses': 1.2, 'Workshops': 3.3, 'Hackathons_Events': 3.4, 'Clubs_Orgs': 3.0,
+            'LinkedIn_Optimized': 1.6, 'CV_Ready': 1.0, 'Career_Fair': 3.6,
+            'Alumni_Network': 2.2, 'Professors': 2.0, 'Job_Platforms': 2.6,
+            'Direct_Apply': 2.4, 'Company_Contact': 2.0, 'Interview': 1.0
+        }
+    return {act: {'difficulty': difficulty[act], 'deficit': deficit[act], 'hours': hours[act]} for act in hours}
@@ -0,0 +1,347 @@
+"""JSON path-query service on asyncio.
+
+    python Dijkstra.py serve --port 8080 --workers 2
+
+POST /path   {"personality": "Shy"} or {"weights": {...}}, optional "hours",
+             "strategy" and "budget"; returns path, cost and key decisions
+POST /batch  {"queries": [...]}; returns {"results": [...]} in query order
+GET  /stats  request, cache and coalescing counters
+GET  /health
+
+Recent results are kept in a bounded LRU and batches of at least
+--pool-threshold queries are deduplicated and solved in a process pool;
+a query whose key is already being solved there waits for that result.
+Single queries below the threshold are solved inline. Everything here is
+standard library.
+"""
+import asyncio
+import json
+import math
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from .internship_graph import ACTIVITY_NAMES, SEARCH_STRATEGIES, build_graph
+from .sample_profiles import PERSONALITIES, get_sample_hours, get_sample_weights
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_POOL_THRESHOLD = 64
+MAX_BODY_BYTES = 1 << 20
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class QueryError(ValueError):
+    """A request body that cannot be turned into a path query."""
+
+
+# -------------------------
+# Queries
+# -------------------------
+def normalize_query(query):
+    """Validated, canonical form of one query; equal queries normalize to equal keys."""
+    if not isinstance(query, dict):
+        raise QueryError("query must be a JSON object")
+    personality = query.get('personality')
+    if personality is not None and personality not in PERSONALITIES:
+        raise QueryError(f"unknown personality {personality!r}; expected one of {PERSONALITIES}")
+    weights = query.get('weights')
+    if weights is None:
+        if personality is None:
+            raise QueryError("give a personality or explicit weights")
+        weights = get_sample_weights(personality)
+    weights = _activity_values(weights, 'weights')
+    hours = query.get('hours')
+    if hours is None and personality is not None:
+        hours = get_sample_hours(personality)
+    if hours is not None:
+        hours = _activity_values(hours, 'hours')
+
+    strategy = query.get('strategy', 'dijkstra')
+    if strategy not in SEARCH_STRATEGIES:
+        raise QueryError(f"unknown strategy {strategy!r}; expected one of {SEARCH_STRATEGIES}")
+    budget = query.get('budget')
+    if budget is not None:
+        if not _is_hours(budget):
+            raise QueryError("budget must be a non-negative number of hours")
+        if hours is None:
+            raise QueryError("a budget needs hours (or a personality to take them from)")
+        budget = float(budget)
+    return {'weights': weights, 'hours': hours, 'strategy': strategy, 'budget': budget}
+
+
+def _activity_values(values, name):
+    if not isinstance(values, dict):
+        raise QueryError(f"{name} must map activities to numbers")
+    missing = [a for a in ACTIVITY_NAMES if a not in values]
+    if missing:
+        raise QueryError(f"{name} is missing {', '.join(missing)}")
+    bad = [a for a in ACTIVITY_NAMES if not _is_hours(values[a])]
+    if bad:
+        raise QueryError(f"{name} values must be finite non-negative numbers; got {', '.join(bad)}")
+    return {a: float(values[a]) for a in ACTIVITY_NAMES}
+
+
+def _is_hours(value):
+    # JSON numbers only: no booleans, strings, NaN, infinities or negatives
+    return (isinstance(value, (int, float)) and not isinstance(value, bool)
+            and math.isfinite(value) and value >= 0)
+
+
+def query_key(query):
+    return json.dumps(query, sort_keys=True)
+
+
+def solve_query(query):
+    """Path, cost and the learning/profile/application choices for a normalized query."""
+    graph = build_graph(query['weights'], hours=query['hours'])
+    if query['budget'] is None:
+        path, cost = graph.find_path("Student", "Internship_Offer", query['strategy'])
+    else:
+        path, cost, _ = graph.constrained_path("Student", "Internship_Offer", query['budget'])
+    if not path:
+        return {'path': [], 'cost': None, 'hours': None, 'decisions': {}}
+    result = {'path': path, 'cost': cost, 'hours': None, 'decisions': {
+        # Student → learning → Develop_Skills → profile → application → Interview → Internship_Offer
+        'learning_method': path[1],
+        'profile_step': path[3],
+        'application_method': path[4],
+    }}
+    if query['hours'] is not None:
+        result['hours'] = sum(graph.edge_data[u][v]['hours'] for u, v in zip(path, path[1:]))
+    return result
+
+
+def solve_queries(queries):
+    # Process-pool work unit
+    return [solve_query(query) for query in queries]
+
+
+# -------------------------
+# Service
+# -------------------------
+class PathService:
+    """Coalescing, caching front end to solve_query().
+
+    path() and batch() are coroutines; run them on one event loop. The pool
+    is only started for batches of at least pool_threshold queries; with a
+    threshold of 1 single queries go through it too.
+    """
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE, workers=None, pool_threshold=DEFAULT_POOL_THRESHOLD):
+        self.cache_size = cache_size
+        self.workers = workers or os.cpu_count() or 1
+        self.pool_threshold = pool_threshold
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._pool = None
+        self.counters = dict.fromkeys(['requests', 'queries', 'cache_hits', 'coalesced', 'solved',
+                                       'pool_batches', 'errors'], 0)
+
+    async def path(self, query):
+        self.counters['queries'] += 1
+        query = normalize_query(query)
+        key = query_key(query)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        if key in self._inflight:
+            self.counters['coalesced'] += 1
+            return await asyncio.shield(self._inflight[key])
+        if self.pool_threshold <= 1:
+            return (await self._solve_pooled({key: query}))[key]
+        # One stock-graph search is microseconds; cheaper inline than a pool round
+        # trip, and nothing else runs on the loop until it returns
+        result = solve_query(query)
+        self.counters['solved'] += 1
+        self._cache_put(key, result)
+        return result
+
+    async def batch(self, queries):
+        if not isinstance(queries, list):
+            raise QueryError("queries must be a JSON array")
+        if len(queries) < self.pool_threshold:
+            return [await self.path(query) for query in queries]
+
+        self.counters['queries'] += len(queries)
+        normalized = [normalize_query(query) for query in queries]
+        keys = [query_key(query) for query in normalized]
+        results = {}
+        waiting = {}
+        todo = {}
+        for key, query in zip(keys, normalized):
+            if key in results or key in waiting or key in todo:
+                self.counters['coalesced'] += 1
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[key] = cached
+            elif key in self._inflight:
+                # Already being solved for another request
+                self.counters['coalesced'] += 1
+                waiting[key] = self._inflight[key]
+            else:
+                todo[key] = query
+        if todo:
+            solved = await self._solve_pooled(todo)
+            results.update(solved)
+        for key, future in waiting.items():
+            results[key] = await asyncio.shield(future)
+        return [results[key] for key in keys]
+
+    async def _solve_pooled(self, todo):
+        # Solve {key: query} in the pool, split into one chunk per worker;
+        # other requests for the same keys wait on the registered futures
+        loop = asyncio.get_running_loop()
+        futures = {key: loop.create_future() for key in todo}
+        self._inflight.update(futures)
+        keys = list(todo)
+        chunks = [keys[i::self.workers] for i in range(min(self.workers, len(keys)))]
+        self.counters['pool_batches'] += 1
+        try:
+            solved = await asyncio.gather(*[
+                loop.run_in_executor(self._executor(), solve_queries, [todo[key] for key in chunk])
+                for chunk in chunks
+            ])
+        except Exception as exc:
+            for future in futures.values():
+                future.set_exception(exc)
+                # Waiters re-raise it; mark it retrieved for keys nobody waits on
+                future.exception()
+            raise
+        finally:
+            for key in keys:
+                del self._inflight[key]
+        results = {}
+        for chunk, chunk_results in zip(chunks, solved):
+            for key, result in zip(chunk, chunk_results):
+                self.counters['solved'] += 1
+                self._cache_put(key, result)
+                futures[key].set_result(result)
+                results[key] = result
+        return results
+
+    def stats(self):
+        return {**self.counters, 'cache_entries': len(self._cache), 'inflight': len(self._inflight)}
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _cache_get(self, key):
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            self.counters['cache_hits'] += 1
+        return result
+
+    def _cache_put(self, key, result):
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+# -------------------------
+# HTTP
+# -------------------------
+async def handle_connection(service, reader, writer):
+    # Minimal HTTP/1.1 with keep-alive: one JSON request per message
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            method, target, version = request_line.decode('latin-1').split(maxsplit=2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get('content-length', 0))
+            if length > MAX_BODY_BYTES:
+                await _respond(writer, 413, {'error': f"body larger than {MAX_BODY_BYTES} bytes"}, close=True)
+                break
+            body = await reader.readexactly(length) if length else b''
+            status, payload = await route(service, method, target.split('?', 1)[0], body)
+            close = (headers.get('connection', '').lower() == 'close'
+                     or (version.strip() == 'HTTP/1.0' and headers.get('connection', '').lower() != 'keep-alive'))
+            await _respond(writer, status, payload, close)
+            if close:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    except asyncio.CancelledError:
+        # Shutdown cancels idle keep-alive connections; nothing left to answer
+        pass
+    finally:
+        writer.close()
+
+
+async def route(service, method, path, body):
+    """(status, JSON payload) for one request."""
+    service.counters['requests'] += 1
+    if path == '/health':
+        return 200, {'status': 'ok'}
+    if path == '/stats':
+        return 200, service.stats()
+    if path not in ('/path', '/batch'):
+        return 404, {'error': f"no route {path}"}
+    if method != 'POST':
+        return 405, {'error': f"{path} takes POST"}
+    try:
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            raise QueryError("body is not valid JSON") from None
+        if path == '/path':
+            return 200, await service.path(request)
+        if not isinstance(request, dict):
+            raise QueryError("body must be a JSON object")
+        return 200, {'results': await service.batch(request.get('queries'))}
+    except QueryError as exc:
+        service.counters['errors'] += 1
+        return 400, {'error': str(exc)}
+    except Exception as exc:
+        service.counters['errors'] += 1
+        return 500, {'error': f"{type(exc).__name__}: {exc}"}
+
+
+async def _respond(writer, status, payload, close=False):
+    body = json.dumps(payload).encode()
+    head = (f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n")
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+
+async def start_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """asyncio.Server bound to host:port; port 0 picks a free one."""
+    return await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, **service_options):
+    service = PathService(**service_options)
+    server = await start_server(service, host, port)
+    bound = server.sockets[0].getsockname()
+    print(f"Serving path queries on http://{bound[0]}:{bound[1]}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
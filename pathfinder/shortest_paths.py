@@ -0,0 +1,134 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Dense Floyd-Warshall is O(V^3) time and O(V^2) memory; above this size
+# all-pairs falls back to one CSR Dijkstra per source
+FLOYD_WARSHALL_MAX_NODES = 512
+
+
+# -------------------------
+# Query results
+# -------------------------
+class ShortestPathTree:
+    """Distances and predecessors from one source; path_to() walks back in O(path length)."""
+
+    def __init__(self, graph, source, dist, prev):
+        self.graph = graph
+        self.source = source
+        self.dist = np.array(dist, dtype=np.float64)
+        self.prev = np.array(prev, dtype=np.int64)
+
+    @property
+    def start(self):
+        return self.graph.nodes[self.source]
+
+    def cost_to(self, target):
+        return float(self.dist[self.graph.index[target]])
+
+    def path_to(self, target):
+        return _walk(self.graph, self.source, self.graph.index[target], self.prev, self.dist)
+
+    def distances(self):
+        return {node: float(d) for node, d in zip(self.graph.nodes, self.dist)}
+
+
+class AllPairsShortestPaths:
+    """dist[i, j] is the cost from node i to node j; prev[i, j] is j's predecessor on that path."""
+
+    def __init__(self, graph, dist, prev):
+        self.graph = graph
+        self.dist = dist
+        self.prev = prev
+
+    def cost(self, start, end):
+        return float(self.dist[self.graph.index[start], self.graph.index[end]])
+
+    def path(self, start, end):
+        source = self.graph.index[start]
+        return _walk(self.graph, source, self.graph.index[end], self.prev[source], self.dist[source])
+
+    def tree(self, start):
+        source = self.graph.index[start]
+        return ShortestPathTree(self.graph, source, self.dist[source], self.prev[source])
+
+
+def _walk(graph, source, target, prev, dist):
+    path = []
+    current = target
+    while current != source:
+        path.append(graph.nodes[current])
+        current = prev[current]
+        if current < 0:
+            return [], float('inf')
+    path.append(graph.nodes[source])
+    path.reverse()
+    return path, float(dist[target])
+
+
+# -------------------------
+# All-pairs solvers
+# -------------------------
+def floyd_warshall(graph):
+    n = graph.num_nodes
+    dist = np.full((n, n), np.inf)
+    prev = np.full((n, n), -1, dtype=np.int64)
+    sources = graph._edge_sources()
+    np.minimum.at(dist, (sources, graph.targets), graph.weights)
+    prev[sources, graph.targets] = sources
+    diagonal = np.arange(n)
+    dist[diagonal, diagonal] = 0.0
+    prev[diagonal, diagonal] = -1
+
+    for k in range(n):
+        via = dist[:, k, np.newaxis] + dist[np.newaxis, k, :]
+        better = via < dist
+        dist[better] = via[better]
+        prev[better] = np.broadcast_to(prev[k], prev.shape)[better]
+    return dist, prev
+
+
+def dijkstra_trees(graph, sources, workers=None):
+    # One full CSR Dijkstra per source, spread over processes for large graphs
+    sources = list(sources)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(sources) < 2 * workers:
+        trees = []
+        for source in sources:
+            graph._search(source)
+            trees.append(ShortestPathTree(graph, source, graph._dist, graph._prev))
+        return trees
+
+    chunks = [sources[i::workers] for i in range(workers)]
+    arrays = {}
+    # A graph loaded from an image is mapped by each worker instead of copied to it
+    if graph.image_path is not None:
+        initargs = (graph.image_path,)
+    else:
+        initargs = (None, graph.nodes, graph.offsets, graph.targets, graph.weights)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        for chunk, results in zip(chunks, pool.map(_solve_sources, chunks)):
+            arrays.update(zip(chunk, results))
+    return [ShortestPathTree(graph, source, *arrays[source]) for source in sources]
+
+
+_worker_graph = None
+
+
+def _init_worker(image_path, *arrays):
+    global _worker_graph
+    if image_path is not None:
+        from .graph_store import load_graph
+        _worker_graph = load_graph(image_path)
+    else:
+        from .compiled_graph import CompiledGraph
+        _worker_graph = CompiledGraph(*arrays)
+
+
+def _solve_sources(sources):
+    results = []
+    for source in sources:
+        _worker_graph._search(source)
+        results.append((np.array(_worker_graph._dist), np.array(_worker_graph._prev)))
+    return results
@@ -0,0 +1,43 @@
+"""Survey column names and the activity-to-question mapping.
+
+Plain data, so cache keys can be built without importing pandas.
+"""
+# -------------------------
+# Survey columns
+# -------------------------
+ACADEMIC_LEVEL_COLUMN = 'What is your current academic level?'
+PERSONALITY_COLUMN = 'How would you describe your personality in social situations?'
+FREE_TIME_COLUMN = 'How much free time do you have per week for internship preparation?'
+ENERGY_COLUMN = 'How is your energy level during a typical week?'
+
+# -------------------------
+# Map activities to columns
+# -------------------------
+ACTIVITIES = {
+    'Free_Courses': {'difficulty': 'How difficult is doing skill-building activities (courses, Youtube, certifications) for you personally?',
+                     'value': 'How valuable do you think skill-building is for getting an internship?'},
+    'Workshops': {'difficulty': 'How difficult is attending workshops for you personally?',
+                  'value': 'How valuable do you think attending workshops is for getting an internship?'},
+    'Hackathons_Events': {'difficulty': 'How difficult is participating in hackathons for you personally?',
+                          'value': 'How valuable do you think hackathons are for getting an internship?'},
+    'Clubs_Orgs': {'difficulty': 'How difficult is joining a student club / association for you personally?',
+                   'value': 'How valuable do you think company visits are for getting an internship?'},
+    'LinkedIn_Optimized': {'difficulty': 'How difficult is improving your LinkedIn profile for you personally?',
+                           'value': 'How valuable do you think optimizing LinkedIn is for getting an internship?'},
+    'CV_Ready': {'difficulty': 'How difficult is updating your CV for you personally?',
+                 'value': 'How valuable do you think updating your CV is for getting an internship?'},
+    'Career_Fair': {'difficulty': 'How difficult is attending career fairs for you personally?',
+                    'value': 'How valuable do you think career fairs are for getting an internship?'},
+    'Alumni_Network': {'difficulty': 'How difficult is talking to alumni for you personally?',
+                       'value': 'How valuable do you think talking to alumni is for getting an internship?'},
+    'Professors': {'difficulty': 'How difficult is contacting a professor for you personally?',
+                   'value': 'How valuable do you think contacting HR / networking is for getting an internship?'},  # proxy
+    'Job_Platforms': {'difficulty': 'How difficult is searching in job platforms for you personally?',
+                      'value': 'How valuable do you think searching in job platforms is for getting an internship?'},
+    'Direct_Apply': {'difficulty': 'How difficult is sending spontaneous applications for you personally?',
+                     'value': 'How valuable do you think spontaneous applications are for getting an internship?'},
+    'Company_Contact': {'difficulty': 'How difficult is contacting HR or employees on LinkedIn for you personally?',
+                        'value': 'How valuable do you think contacting HR / networking is for getting an internship?'},
+    'Interview': {'difficulty': 'How difficult is preparing for internship interviews for you personally?',
+                  'value': 6}  # fixed high value
+}
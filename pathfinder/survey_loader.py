@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+from .instrumentation import phase_timer
+from .survey_weights import (ACADEMIC_LEVEL_COLUMN, ACTIVITIES, PERSONALITY_COLUMN, group_codes, group_sums,
+                             means_from_sums, score_columns, score_matrix, weights_from_means)
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def survey_dtypes(by=PERSONALITY_COLUMN, activities=ACTIVITIES, compact_scores=True, extra_columns=()):
+    """Columns needed for weight computation, mapped to compact dtypes."""
+    keys = [by] if isinstance(by, str) else list(by)
+    dtypes = {col: 'object' for col in extra_columns}
+    dtypes[ACADEMIC_LEVEL_COLUMN] = 'category'
+    for key in keys:
+        dtypes[key] = 'category'
+    for col in score_columns(activities):
+        dtypes.setdefault(col, 'float32' if compact_scores else 'object')
+    return dtypes
+
+
+def read_survey_chunks(paths, by=PERSONALITY_COLUMN, activities=ACTIVITIES, chunksize=DEFAULT_CHUNKSIZE,
+                       compact_scores=True, extra_columns=()):
+    # Only the needed columns are parsed; columns missing from an older form
+    # revision are simply absent from that file's chunks
+    if isinstance(paths, str):
+        paths = [paths]
+    dtypes = survey_dtypes(by, activities, compact_scores, extra_columns)
+    for path in paths:
+        reader = pd.read_csv(path, usecols=lambda col: col in dtypes, dtype=dtypes, chunksize=chunksize)
+        with reader:
+            for chunk in reader:
+                if ACADEMIC_LEVEL_COLUMN in chunk.columns:
+                    chunk = chunk[chunk[ACADEMIC_LEVEL_COLUMN].notna()]
+                yield chunk
+
+
+class WeightAccumulator:
+    """Running per-group score sums and counts, mergeable across chunks and files."""
+
+    def __init__(self, by=PERSONALITY_COLUMN, activities=ACTIVITIES):
+        self.by = by
+        self.keys = [by] if isinstance(by, str) else list(by)
+        self.activities = activities
+        self.columns = score_columns(activities)
+        self.rows = 0
+        self._groups = {}
+        self._sums = np.zeros((0, len(self.columns)))
+        self._counts = np.zeros((0, len(self.columns)))
+
+    def _rows_for(self, labels):
+        positions = []
+        for label in labels:
+            if label not in self._groups:
+                self._groups[label] = len(self._groups)
+            positions.append(self._groups[label])
+        grow = len(self._groups) - len(self._sums)
+        if grow:
+            self._sums = np.vstack([self._sums, np.zeros((grow, len(self.columns)))])
+            self._counts = np.vstack([self._counts, np.zeros((grow, len(self.columns)))])
+        return np.array(positions, dtype=np.int64)
+
+    def add(self, chunk):
+        scores = score_matrix(chunk, self.activities).reindex(columns=self.columns)
+        codes, index = group_codes(chunk, self.by)
+        sums, counts = group_sums(codes, len(index), scores.to_numpy())
+        positions = self._rows_for(index.tolist())
+        self._sums[positions] += sums
+        self._counts[positions] += counts
+        self.rows += len(chunk)
+
+    def merge(self, other):
+        positions = self._rows_for(list(other._groups))
+        self._sums[positions] += other._sums
+        self._counts[positions] += other._counts
+        self.rows += other.rows
+
+    def means(self):
+        labels = list(self._groups)
+        if len(self.keys) == 1:
+            index = pd.Index(labels, name=self.keys[0])
+        else:
+            index = pd.MultiIndex.from_tuples(labels, names=self.keys)
+        return means_from_sums(self._sums, self._counts, index, self.columns)
+
+    def weights(self):
+        return weights_from_means(self.means(), self.activities)
+
+
+def _consume(part, chunks, stats):
+    # Reading a chunk counts as CSV load, folding it in as weight aggregation
+    while True:
+        with phase_timer(stats, 'csv_load'):
+            chunk = next(chunks, None)
+        if chunk is None:
+            return part
+        with phase_timer(stats, 'weight_aggregation'):
+            part.add(chunk)
+
+
+def accumulate_weights(paths, by=PERSONALITY_COLUMN, activities=ACTIVITIES, chunksize=DEFAULT_CHUNKSIZE,
+                       stats=None):
+    if isinstance(paths, str):
+        paths = [paths]
+    total = WeightAccumulator(by, activities)
+    for path in paths:
+        # Accumulate per file so a file whose score columns hold free text can
+        # be re-read with text columns without double counting
+        try:
+            part = _consume(WeightAccumulator(by, activities),
+                            read_survey_chunks(path, by, activities, chunksize), stats)
+        except ValueError:
+            part = _consume(WeightAccumulator(by, activities),
+                            read_survey_chunks(path, by, activities, chunksize, compact_scores=False), stats)
+        total.merge(part)
+    return total
+
+
+def stream_weights(paths, by=PERSONALITY_COLUMN, activities=ACTIVITIES, chunksize=DEFAULT_CHUNKSIZE):
+    """Same table as compute_weights(), computed in bounded memory over one or more exports."""
+    return accumulate_weights(paths, by, activities, chunksize).weights()
@@ -0,0 +1,252 @@
+import numpy as np
+import pandas as pd
+
+from .instrumentation import phase_timer
+from .internship_graph import PARETO_OBJECTIVES
+from .survey_columns import (ACADEMIC_LEVEL_COLUMN, ACTIVITIES, ENERGY_COLUMN, FREE_TIME_COLUMN,  # noqa: F401
+                             PERSONALITY_COLUMN)
+
+# Defaults used when a group has no usable answer for a column
+DEFAULT_DIFFICULTY = 3.0
+DEFAULT_VALUE = 4.0
+# Top of the value scale; the value deficit objective is MAX_VALUE - value
+MAX_VALUE = 7.0
+
+# -------------------------
+# Time estimates
+# -------------------------
+ACTIVITY_TIME_COLUMNS = {
+    'Free_Courses': 'How long do you think doing skill-building activities (courses, YouTube, certifications) typically takes you?',
+    'Workshops': 'How long do you think attending workshops typically takes you?',
+    'Hackathons_Events': 'How long do you think participating in hackathons typically takes you?',
+    'Clubs_Orgs': 'How long do you think joining a student club / association typically takes you?',
+    'LinkedIn_Optimized': 'How long do you think improving your LinkedIn profile typically takes you?',
+    'CV_Ready': 'How long do you think updating your CV typically takes you?',
+    'Career_Fair': 'How long do you think attending career fairs typically takes you?',
+    'Alumni_Network': 'How long do you think talking to alumni typically takes you?',
+    'Professors': 'How long do you think contacting a professor typically takes you?',
+    'Job_Platforms': 'How long do you think searching in job platforms typically takes you?',
+    'Direct_Apply': 'How long do you think sending spontaneous applications typically takes you?',
+    'Company_Contact': 'How long do you think contacting HR or employees on LinkedIn typically takes you?',
+    'Interview': 'How long do you think preparing for internship interviews typically takes you?',
+}
+
+# Hours assumed for each answer bucket
+DURATION_HOURS = {
+    'Less than 1 hour': 0.5,
+    '1-3 hours': 2.0,
+    '3-5 hours': 4.0,
+    '1 day': 8.0,
+    'More than 1 day': 16.0,
+}
+DEFAULT_HOURS = 2.0
+
+
+def score_columns(activities=ACTIVITIES):
+    # Every difficulty/value question referenced by the mapping, each listed once
+    columns = []
+    for cols in activities.values():
+        for key in ('difficulty', 'value'):
+            col = cols[key]
+            if isinstance(col, str) and col not in columns:
+                columns.append(col)
+    return columns
+
+
+def _normalize_durations(answers):
+    # Dash variants and spacing differ between exports: "1–3 hours", "1 - 3 hours"
+    text = answers.astype(str).str.replace('[\u2012\u2013\u2014\u2212]', '-', regex=True)
+    return text.str.replace(r'\s*-\s*', '-', regex=True).str.split().str.join(' ').str.lower()
+
+
+_DURATION_LOOKUP = dict(zip(_normalize_durations(pd.Series(list(DURATION_HOURS))), DURATION_HOURS.values()))
+
+
+def parse_durations(values):
+    """Hours for bucketed duration answers such as "1–3 hours"; NaN for blank or unknown answers."""
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame({col: parse_durations(values[col]) for col in values.columns}, index=values.index)
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(np.float64)
+    # Only the distinct answers are normalized and looked up
+    codes, uniques = pd.factorize(series)
+    hours = _normalize_durations(pd.Series(uniques, dtype=object)).map(_DURATION_LOOKUP)
+    hours = np.append(hours.to_numpy(dtype=np.float64, na_value=np.nan), np.nan)
+    return pd.Series(hours[codes], index=series.index, name=series.name)
+
+
+def score_matrix(df, activities=ACTIVITIES):
+    # Coerce each score column to float exactly once
+    columns, arrays = score_arrays(df, activities)
+    # Column-major so each score column is contiguous for the per-column reductions
+    values = np.empty((len(df), len(columns)), order='F')
+    for j, array in enumerate(arrays):
+        values[:, j] = array
+    return pd.DataFrame(values, index=df.index, columns=columns)
+
+
+def score_arrays(df, activities=ACTIVITIES):
+    # Score column names and one float array per column; float64 columns are not copied
+    columns = [col for col in score_columns(activities) if col in df.columns]
+    return columns, [_to_float(df[col]) for col in columns]
+
+
+def _to_float(column):
+    if column.dtype == np.float64:
+        return column.to_numpy()
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+    # Text answers repeat a handful of values, so parse each distinct one once
+    codes, uniques = pd.factorize(column)
+    parsed = np.append(pd.to_numeric(pd.Series(uniques), errors='coerce').to_numpy(dtype=np.float64), np.nan)
+    return parsed[codes]
+
+
+def group_codes(df, by):
+    """Integer group code per row (-1 where any key is missing) and the group index."""
+    keys = [by] if isinstance(by, str) else list(by)
+    if len(keys) == 1:
+        codes, uniques = pd.factorize(df[keys[0]])
+        return codes.astype(np.int64), pd.Index(uniques, name=keys[0])
+    combined = np.zeros(len(df), dtype=np.int64)
+    valid = np.ones(len(df), dtype=bool)
+    levels = []
+    for key in keys:
+        codes, uniques = pd.factorize(df[key])
+        valid &= codes >= 0
+        combined = combined * len(uniques) + codes
+        levels.append(uniques)
+    codes = np.full(len(df), -1, dtype=np.int64)
+    codes[valid], groups = pd.factorize(combined[valid])
+
+    # Decode the mixed-radix group ids back into one label array per key
+    labels = []
+    remainder = np.asarray(groups, dtype=np.int64)
+    for uniques in reversed(levels):
+        remainder, level_codes = np.divmod(remainder, len(uniques))
+        labels.append(uniques.take(level_codes))
+    labels.reverse()
+    return codes, pd.MultiIndex.from_arrays(labels, names=keys)
+
+
+def group_sums(codes, n_groups, values):
+    # Per-group sums and non-missing counts of every column, ignoring NaN.
+    # values is a 2-D array or a list of its columns. Bin 0 collects rows
+    # without a group, so no column is ever filtered by group.
+    columns = list(values.T) if isinstance(values, np.ndarray) else values
+    sums = np.empty((n_groups, len(columns)))
+    counts = np.empty((n_groups, len(columns)))
+    bins = codes + 1
+    rows = np.bincount(bins, minlength=n_groups + 1)
+    for j, column in enumerate(columns):
+        missing = np.isnan(column)
+        answered = rows
+        if missing.any():
+            # Missing answers are rare: zero them and subtract their counts
+            column = np.where(missing, 0.0, column)
+            answered = rows - np.bincount(bins[missing], minlength=n_groups + 1)
+        sums[:, j] = np.bincount(bins, weights=column, minlength=n_groups + 1)[1:]
+        counts[:, j] = answered[1:]
+    return sums, counts
+
+
+def means_from_sums(sums, counts, index, columns):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    return pd.DataFrame(means, index=index, columns=columns)
+
+
+def weights_from_means(means, activities=ACTIVITIES):
+    """Turn a table of per-column mean scores into difficulty / value weights."""
+    weights = {}
+    for act, cols in activities.items():
+        avg_diff, avg_val = _difficulty_value(means, cols)
+        # Weight: lower is better
+        weights[act] = avg_diff / avg_val
+    return pd.DataFrame(weights, index=means.index)
+
+
+def _difficulty_value(means, cols):
+    if cols['difficulty'] in means.columns:
+        avg_diff = means[cols['difficulty']].fillna(DEFAULT_DIFFICULTY)
+    else:
+        avg_diff = pd.Series(DEFAULT_DIFFICULTY, index=means.index)
+    if isinstance(cols['value'], (int, float)):
+        avg_val = cols['value']
+    elif cols['value'] in means.columns:
+        avg_val = means[cols['value']].fillna(DEFAULT_VALUE)
+    else:
+        avg_val = DEFAULT_VALUE
+    return avg_diff, avg_val
+
+
+def objectives_from_means(means, hours, activities=ACTIVITIES):
+    """Separate per-activity objectives instead of the single difficulty / value ratio.
+
+    Returns {objective: table} for PARETO_OBJECTIVES, each table having the
+    rows of `means` and one column per activity.
+    """
+    difficulty = {}
+    deficit = {}
+    for act, cols in activities.items():
+        avg_diff, avg_val = _difficulty_value(means, cols)
+        difficulty[act] = avg_diff
+        deficit[act] = MAX_VALUE - avg_val
+    tables = {
+        'difficulty': pd.DataFrame(difficulty, index=means.index),
+        'deficit': pd.DataFrame(deficit, index=means.index),
+        'hours': hours.reindex(columns=list(activities)).fillna(DEFAULT_HOURS),
+    }
+    return {name: tables[name] for name in PARETO_OBJECTIVES}
+
+
+def compute_weights(df, by=PERSONALITY_COLUMN, activities=ACTIVITIES, stats=None):
+    """Weights table with one row per group of `by` and one column per activity.
+
+    `by` is a column name or a list of column names, e.g. the personality,
+    academic level, free time or energy level question.
+    """
+    with phase_timer(stats, 'weight_aggregation'):
+        # Reduce the score columns in place; no respondent x column matrix is built
+        columns, arrays = score_arrays(df, activities)
+        codes, index = group_codes(df, by)
+        sums, counts = group_sums(codes, len(index), arrays)
+        return weights_from_means(means_from_sums(sums, counts, index, columns), activities)
+
+
+def activity_hours(df, by=PERSONALITY_COLUMN, time_columns=ACTIVITY_TIME_COLUMNS):
+    """Mean hours per activity for each group of `by`; unanswered activities get DEFAULT_HOURS."""
+    hours = _hours_matrix(df, time_columns)
+    codes, index = group_codes(df, by)
+    sums, counts = group_sums(codes, len(index), hours.to_numpy())
+    means = means_from_sums(sums, counts, index, hours.columns)
+    return means.reindex(columns=list(time_columns)).fillna(DEFAULT_HOURS)
+
+
+def _hours_matrix(df, time_columns=ACTIVITY_TIME_COLUMNS):
+    # Parsed hours, one column per activity whose question is present
+    present = {act: col for act, col in time_columns.items() if col in df.columns}
+    hours = np.empty((len(df), len(present)), order='F')
+    for j, col in enumerate(present.values()):
+        hours[:, j] = parse_durations(df[col]).to_numpy()
+    return pd.DataFrame(hours, index=df.index, columns=list(present))
+
+
+def activity_objectives(df, by=PERSONALITY_COLUMN, activities=ACTIVITIES, time_columns=ACTIVITY_TIME_COLUMNS):
+    """Difficulty, value deficit and hours per activity for each group of `by`."""
+    scores = score_matrix(df, activities)
+    codes, index = group_codes(df, by)
+    sums, counts = group_sums(codes, len(index), scores.to_numpy())
+    means = means_from_sums(sums, counts, index, scores.columns)
+    return objectives_from_means(means, activity_hours(df, by, time_columns), activities)
+
+
+def respondent_weights(df, activities=ACTIVITIES):
+    # Same ratios, one row per respondent
+    return weights_from_means(score_matrix(df, activities), activities)
+
+
+def respondent_objectives(df, activities=ACTIVITIES, time_columns=ACTIVITY_TIME_COLUMNS):
+    # Same objectives, one row per respondent
+    return objectives_from_means(score_matrix(df, activities), _hours_matrix(df, time_columns), activities)
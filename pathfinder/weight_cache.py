@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'internship_pathfinder')
+DEFAULT_MAX_ENTRIES = 32
+
+
+class WeightCache:
+    """On-disk LRU cache of derived weights and solved paths.
+
+    Entries are keyed by the content hash of the source CSVs plus the
+    activity mapping, so editing either one yields a fresh key.
+    """
+
+    def __init__(self, directory=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.directory = directory or os.environ.get('PATHFINDER_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_entries = max_entries
+        os.makedirs(self.directory, exist_ok=True)
+        self._digest_file = os.path.join(self.directory, 'digests.json')
+
+    # -------------------------
+    # Keys
+    # -------------------------
+    def file_digest(self, path):
+        # Re-hash only when size or mtime changed since the last run
+        stat = os.stat(path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        digests = self._load_digests()
+        entry = digests.get(os.path.abspath(path))
+        if entry and entry['stamp'] == stamp:
+            return entry['sha256']
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha.update(block)
+        digests[os.path.abspath(path)] = {'stamp': stamp, 'sha256': sha.hexdigest()}
+        self._atomic_write(self._digest_file, json.dumps(digests).encode())
+        return sha.hexdigest()
+
+    def key(self, paths, activities, **extra):
+        if isinstance(paths, str):
+            paths = [paths]
+        parts = {
+            'files': [self.file_digest(path) for path in paths],
+            'activities': activities,
+            'extra': extra,
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+    # -------------------------
+    # Entries
+    # -------------------------
+    def get(self, key):
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        # ImportError/AttributeError: pickled by a version whose modules have since moved
+        except (OSError, EOFError, pickle.UnpicklingError, ImportError, AttributeError):
+            return None
+        os.utime(path)  # mark as recently used
+        return value
+
+    def put(self, key, value):
+        self._atomic_write(self._entry_path(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self._evict()
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(self.directory, name))
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _evict(self):
+        entries = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith('.pkl')]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _load_digests(self):
+        try:
+            with open(self._digest_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _atomic_write(self, path, data):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)